@@ -1,10 +1,22 @@
 """Base adapter interface for CLI tools."""
 
+import json
 from abc import ABC, abstractmethod
+from functools import cache
 from typing import Any
 
 from agent_chime.events import Event, Source
 
+# JSON parser shared by the adapters: orjson on the hot notification path,
+# falling back to a stdlib decoder bound once so calls skip json.loads'
+# keyword handling. Both raise ValueError subclasses on malformed input.
+try:
+    import orjson
+
+    loads_json = orjson.loads
+except ImportError:
+    loads_json = json.JSONDecoder().decode
+
 
 class Adapter(ABC):
     """
@@ -14,6 +26,9 @@ class Adapter(ABC):
     and converting it to agent-chime events.
     """
 
+    # Whether the CLI should read stdin and pass it to parse()
+    wants_stdin: bool = False
+
     @property
     @abstractmethod
     def source(self) -> Source:
@@ -41,8 +56,14 @@ class Adapter(ABC):
         ...
 
 
+@cache
 def get_adapter(source: Source) -> Adapter:
-    """Get the appropriate adapter for a source."""
+    """
+    Get the appropriate adapter for a source.
+
+    Adapters are stateless, so a single instance per source is created
+    on first use and reused for subsequent calls.
+    """
     from agent_chime.adapters.claude import ClaudeAdapter
     from agent_chime.adapters.codex import CodexAdapter
     from agent_chime.adapters.opencode import OpenCodeAdapter
@@ -1,10 +1,10 @@
 """Claude Code adapter for parsing hook events."""
 
-import json
 import logging
+import re
 from typing import Any
 
-from agent_chime.adapters.base import Adapter
+from agent_chime.adapters.base import Adapter, loads_json
 from agent_chime.events import Event, EventType, Source
 
 logger = logging.getLogger(__name__)
@@ -15,6 +15,10 @@ CLAUDE_EVENT_MAP: dict[str, EventType] = {
     "Notification": EventType.AGENT_YIELD,
 }
 
+# Hook event and tool that signal Claude is asking the user a question
+PRE_TOOL_USE_EVENT = "PreToolUse"
+ASK_USER_QUESTION_TOOL = "AskUserQuestion"
+
 # Keywords in reason that indicate a decision is needed
 DECISION_KEYWORDS = [
     "need your",
@@ -26,6 +30,12 @@ DECISION_KEYWORDS = [
     "approve",
 ]
 
+# Single-pass, case-insensitive matcher for DECISION_KEYWORDS
+_DECISION_RE = re.compile("|".join(map(re.escape, DECISION_KEYWORDS)), re.IGNORECASE)
+
+# Decision cues appear near the start of the reason; don't scan long transcripts
+DECISION_SCAN_LIMIT = 256
+
 
 class ClaudeAdapter(Adapter):
     """
@@ -42,6 +52,8 @@ class ClaudeAdapter(Adapter):
     }
     """
 
+    wants_stdin = True
+
     @property
     def source(self) -> Source:
         return Source.CLAUDE
@@ -69,8 +81,8 @@ class ClaudeAdapter(Adapter):
             return None, {}
 
         try:
-            payload = json.loads(stdin_data)
-        except json.JSONDecodeError as e:
+            payload = loads_json(stdin_data)
+        except ValueError as e:
             logger.error(f"Failed to parse Claude Code JSON: {e}")
             return None, {}
 
@@ -99,9 +111,9 @@ class ClaudeAdapter(Adapter):
     def _map_event_type(self, hook_event: str, payload: dict[str, Any]) -> EventType | None:
         """Map a Claude hook event to an agent-chime event type."""
         # Check for AskUserQuestion in PreToolUse
-        if hook_event == "PreToolUse":
+        if hook_event == PRE_TOOL_USE_EVENT:
             tool_name = payload.get("tool_name", "")
-            if tool_name == "AskUserQuestion":
+            if tool_name == ASK_USER_QUESTION_TOOL:
                 return EventType.DECISION_REQUIRED
             # Ignore other PreToolUse events
             return None
@@ -111,8 +123,8 @@ class ClaudeAdapter(Adapter):
 
         # Check if Stop event indicates a decision is needed
         if event_type == EventType.AGENT_YIELD:
-            reason = payload.get("reason", "").lower()
-            if any(keyword in reason for keyword in DECISION_KEYWORDS):
+            reason = payload.get("reason", "")
+            if _DECISION_RE.search(reason, 0, DECISION_SCAN_LIMIT):
                 return EventType.DECISION_REQUIRED
 
         return event_type
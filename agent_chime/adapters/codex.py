@@ -1,10 +1,9 @@
 """Codex adapter for parsing notify events."""
 
-import json
 import logging
 from typing import Any
 
-from agent_chime.adapters.base import Adapter
+from agent_chime.adapters.base import Adapter, loads_json
 from agent_chime.events import Event, EventType, Source
 
 logger = logging.getLogger(__name__)
@@ -56,8 +55,8 @@ class CodexAdapter(Adapter):
         json_data = argv_data[0] if argv_data else ""
 
         try:
-            payload = json.loads(json_data)
-        except json.JSONDecodeError as e:
+            payload = loads_json(json_data)
+        except ValueError as e:
             logger.error(f"Failed to parse Codex JSON: {e}")
             return None, {}
 
@@ -4,17 +4,65 @@ import hashlib
 import logging
 import os
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Cache keys only need 64 bits of digest, so use the fastest hash available
+try:
+    from blake3 import blake3 as _hasher  # ty: ignore[unresolved-import]
+
+    HASH_NAME = "blake3"
+
+    def _new_hash():
+        return _hasher()
+
+except ImportError:
+    HASH_NAME = "blake2b"
+
+    def _new_hash():
+        return hashlib.blake2b(digest_size=8)
+
+
+# Bump when the key derivation changes. Keys are namespaced by version and
+# hash so entries written under another scheme are never mistaken for hits;
+# they simply age out of the LRU.
+CACHE_VERSION = 2
+KEY_PREFIX = f"v{CACHE_VERSION}-{HASH_NAME}-"
+
 # Default cache settings
 DEFAULT_MAX_SIZE_MB = 100
 DEFAULT_MAX_ENTRIES = 1000
 
+# Stat cache files on a thread pool when loading more than this many
+PARALLEL_STAT_THRESHOLD = 256
+PARALLEL_STAT_WORKERS = 8
+
+
+def _stat_or_none(dir_entry: os.DirEntry) -> os.stat_result | None:
+    """Stat a directory entry, returning None if it vanished or is unreadable."""
+    try:
+        return dir_entry.stat()
+    except OSError:
+        return None
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """Write data to path with a single unbuffered descriptor."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """Metadata for a cached audio file."""
 
@@ -32,6 +80,10 @@ class AudioCache:
     LRU cache for synthesized audio files.
 
     Keyed by (text, voice, model) and stored at ~/.cache/agent-chime/
+
+    The on-disk index is loaded lazily on first use (any lookup, write,
+    clear or stats call), so constructing a cache that is never touched
+    costs no filesystem work.
     """
 
     def __init__(
@@ -44,17 +96,30 @@ class AudioCache:
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.max_entries = max_entries
 
-        # Ensure cache directory exists
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # In-memory index of cache entries, ordered least to most recently used
+        self._index: OrderedDict[str, CacheEntry] = OrderedDict()
+        # Running total of entry sizes, kept in sync with the index
+        self._total_bytes = 0
+        self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        """Create the cache directory and load the index on first use."""
+        if self._loaded:
+            return
 
-        # In-memory index of cache entries
-        self._index: dict[str, CacheEntry] = {}
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._load_index()
+        self._loaded = True
 
     def _cache_key(self, text: str, voice: str, model: str) -> str:
         """Generate a cache key from synthesis parameters."""
-        content = f"{text}|{voice}|{model}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        # Length-prefix each field so values containing a separator can't collide
+        h = _new_hash()
+        for part in (text, voice, model):
+            data = part.encode()
+            h.update(len(data).to_bytes(4, "little"))
+            h.update(data)
+        return KEY_PREFIX + h.hexdigest()[:16]
 
     def _cache_path(self, key: str) -> Path:
         """Get the file path for a cache key."""
@@ -72,6 +137,32 @@ class AudioCache:
         Returns:
             WAV bytes if cached, None otherwise
         """
+        path = self.get_path(text, voice, model)
+        if path is None:
+            return None
+
+        try:
+            return path.read_bytes()
+        except OSError as e:
+            logger.warning(f"Failed to read cache entry {path.stem}: {e}")
+            return None
+
+    def get_path(self, text: str, voice: str, model: str) -> Path | None:
+        """
+        Get the path of cached audio if available.
+
+        Lets callers hand the cached file straight to the player
+        without reading it into memory.
+
+        Args:
+            text: The synthesized text
+            voice: The voice used
+            model: The model used
+
+        Returns:
+            Path to the cached WAV file, None if not cached
+        """
+        self._ensure_loaded()
         key = self._cache_key(text, voice, model)
         entry = self._index.get(key)
 
@@ -81,16 +172,14 @@ class AudioCache:
         if not entry.path.exists():
             # File was deleted externally
             del self._index[key]
+            self._total_bytes -= entry.size_bytes
             return None
 
-        # Update access time
+        # Update access time and LRU position
         entry.last_accessed = time.time()
+        self._index.move_to_end(key)
 
-        try:
-            return entry.path.read_bytes()
-        except OSError as e:
-            logger.warning(f"Failed to read cache entry {key}: {e}")
-            return None
+        return entry.path
 
     def put(self, text: str, voice: str, model: str, audio: bytes) -> None:
         """
@@ -102,6 +191,7 @@ class AudioCache:
             model: The model used
             audio: The WAV audio bytes
         """
+        self._ensure_loaded()
         key = self._cache_key(text, voice, model)
         path = self._cache_path(key)
 
@@ -109,80 +199,103 @@ class AudioCache:
         self._evict_if_needed(len(audio))
 
         try:
-            path.write_bytes(audio)
+            _write_file(path, audio)
+            if (previous := self._index.get(key)) is not None:
+                self._total_bytes -= previous.size_bytes
+            now = time.time()
             self._index[key] = CacheEntry(
                 path=path,
                 text=text,
                 voice=voice,
                 model=model,
                 size_bytes=len(audio),
-                created_at=time.time(),
-                last_accessed=time.time(),
+                created_at=now,
+                last_accessed=now,
             )
+            self._index.move_to_end(key)
+            self._total_bytes += len(audio)
             logger.debug(f"Cached audio for '{text[:30]}...' ({len(audio)} bytes)")
         except OSError as e:
             logger.warning(f"Failed to cache audio: {e}")
 
     def _evict_if_needed(self, new_size: int) -> None:
         """Evict oldest entries if cache is full."""
-        current_size = sum(e.size_bytes for e in self._index.values())
-
         # Check entry count
         while len(self._index) >= self.max_entries:
             self._evict_oldest()
 
         # Check size
-        while current_size + new_size > self.max_size_bytes and self._index:
-            evicted_size = self._evict_oldest()
-            current_size -= evicted_size
+        while self._total_bytes + new_size > self.max_size_bytes and self._index:
+            self._evict_oldest()
 
     def _evict_oldest(self) -> int:
         """Evict the least recently accessed entry. Returns size of evicted entry."""
         if not self._index:
             return 0
 
-        # Find LRU entry
-        oldest_key = min(self._index, key=lambda k: self._index[k].last_accessed)
-        entry = self._index[oldest_key]
+        oldest_key, entry = self._index.popitem(last=False)
 
         try:
             entry.path.unlink(missing_ok=True)
         except OSError:
             pass
 
-        del self._index[oldest_key]
+        self._total_bytes -= entry.size_bytes
         logger.debug(f"Evicted cache entry {oldest_key}")
         return entry.size_bytes
 
     def _load_index(self) -> None:
         """Load existing cache entries from disk."""
         self._index.clear()
+        self._total_bytes = 0
 
-        if not self.cache_dir.exists():
+        try:
+            # scandir reuses directory-read results, avoiding a separate
+            # lookup per file the way glob() + stat() would
+            with os.scandir(self.cache_dir) as it:
+                dir_entries = [de for de in it if de.name.endswith(".wav")]
+        except FileNotFoundError:
             return
 
-        for path in self.cache_dir.glob("*.wav"):
-            try:
-                stat = path.stat()
-                key = path.stem
-
-                # We don't have the original text/voice/model, so store placeholders
-                self._index[key] = CacheEntry(
-                    path=path,
-                    text="",
-                    voice="",
-                    model="",
-                    size_bytes=stat.st_size,
-                    created_at=stat.st_ctime,
-                    last_accessed=stat.st_atime,
-                )
-            except OSError:
+        # stat() releases the GIL, so fan out on large (or slow, e.g. network) dirs
+        if len(dir_entries) > PARALLEL_STAT_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=PARALLEL_STAT_WORKERS) as pool:
+                stats = list(pool.map(_stat_or_none, dir_entries))
+        else:
+            stats = [_stat_or_none(de) for de in dir_entries]
+
+        entries: list[tuple[str, CacheEntry]] = []
+        for dir_entry, stat in zip(dir_entries, stats, strict=True):
+            if stat is None:
                 continue
 
+            # We don't have the original text/voice/model, so store placeholders
+            entries.append(
+                (
+                    dir_entry.name[:-4],
+                    CacheEntry(
+                        path=Path(dir_entry.path),
+                        text="",
+                        voice="",
+                        model="",
+                        size_bytes=stat.st_size,
+                        created_at=stat.st_ctime,
+                        last_accessed=stat.st_atime,
+                    ),
+                )
+            )
+
+        # Insert oldest first so the index order reflects LRU across restarts
+        entries.sort(key=lambda item: item[1].last_accessed)
+        for key, entry in entries:
+            self._index[key] = entry
+            self._total_bytes += entry.size_bytes
+
         logger.debug(f"Loaded {len(self._index)} cache entries")
 
     def clear(self) -> None:
         """Clear all cache entries."""
+        self._ensure_loaded()
         for entry in self._index.values():
             try:
                 entry.path.unlink(missing_ok=True)
@@ -190,20 +303,23 @@ class AudioCache:
                 pass
 
         self._index.clear()
+        self._total_bytes = 0
         logger.info("Cache cleared")
 
     @property
     def size_bytes(self) -> int:
         """Get total size of cached files in bytes."""
-        return sum(e.size_bytes for e in self._index.values())
+        self._ensure_loaded()
+        return self._total_bytes
 
     @property
     def entry_count(self) -> int:
         """Get number of cached entries."""
+        self._ensure_loaded()
         return len(self._index)
 
     def stats(self) -> dict[str, int | float]:
-        """Get cache statistics."""
+        """Get cache statistics (loads the index if not yet loaded)."""
         return {
             "entries": self.entry_count,
             "size_bytes": self.size_bytes,
@@ -1,10 +1,17 @@
-"""Audio renderer for playback via afplay."""
+"""Audio renderer for playback via afplay or AVFoundation."""
 
 import logging
+import os
+import queue
 import subprocess
 import tempfile
 import threading
+import time
+from collections.abc import Iterable
+from enum import StrEnum
+from functools import cache
 from pathlib import Path
+from typing import Any
 
 from agent_chime.audio.cache import AudioCache
 from agent_chime.events import EventType
@@ -17,9 +24,35 @@ class PlaybackError(Exception):
     """Error during audio playback."""
 
 
+class PlaybackBackend(StrEnum):
+    """Audio playback backends."""
+
+    AUTO = "auto"  # AVFoundation if PyObjC is installed, otherwise afplay
+    AFPLAY = "afplay"
+    AVFOUNDATION = "avfoundation"
+
+
+@cache
+def _load_avfoundation() -> tuple[Any, Any] | None:
+    """Import AVAudioPlayer and NSData via PyObjC, or None if unavailable."""
+    try:
+        # Optional, macOS-only (the "avfoundation" extra)
+        from AVFoundation import AVAudioPlayer  # ty: ignore[unresolved-import]
+        from Foundation import NSData  # ty: ignore[unresolved-import]
+    except ImportError:
+        return None
+    return AVAudioPlayer, NSData
+
+
 class AudioRenderer:
     """
-    Renders audio for playback using macOS afplay.
+    Renders audio for playback using macOS afplay or AVFoundation.
+
+    With PyObjC's AVFoundation bindings installed, earcons and WAV bytes
+    are played from memory through in-process AVAudioPlayer objects,
+    avoiding an afplay process spawn per playback. PyObjC is imported,
+    and each earcon decoded, only when first played. File and streaming
+    playback always go through afplay.
 
     Supports:
     - WAV playback from bytes
@@ -33,15 +66,47 @@ class AudioRenderer:
         volume: float = 0.8,
         cache: AudioCache | None = None,
         earcons_dir: Path | None = None,
+        backend: PlaybackBackend = PlaybackBackend.AUTO,
     ) -> None:
         self.volume = max(0.0, min(1.0, volume))
         self.cache = cache
         self.earcons_dir = earcons_dir or self._default_earcons_dir()
 
         self._current_process: subprocess.Popen | None = None
-        self._temp_file: Path | None = None
+        self._current_player: Any = None
+        self._scratch_file: Path | None = None
         self._lock = threading.Lock()
 
+        # Resolved on first in-memory playback, so afplay-only runs never import PyObjC
+        self._requested_backend = backend
+        self._warned_missing_avfoundation = False
+
+        self._earcon_paths: dict[EventType, Path] = {}
+        self._earcon_players: dict[EventType, Any] = {}
+        self.reload_earcons()
+
+    @property
+    def backend(self) -> PlaybackBackend:
+        """The backend in-memory playback uses (imports PyObjC on first access)."""
+        if self._avfoundation() is not None:
+            return PlaybackBackend.AVFOUNDATION
+        return PlaybackBackend.AFPLAY
+
+    def _avfoundation(self) -> tuple[Any, Any] | None:
+        """Get the AVFoundation classes if that backend is enabled and installed."""
+        if self._requested_backend == PlaybackBackend.AFPLAY:
+            return None
+
+        api = _load_avfoundation()
+        if (
+            api is None
+            and self._requested_backend == PlaybackBackend.AVFOUNDATION
+            and not self._warned_missing_avfoundation
+        ):
+            logger.warning("AVFoundation bindings not installed, falling back to afplay")
+            self._warned_missing_avfoundation = True
+        return api
+
     def _default_earcons_dir(self) -> Path:
         """Get the default earcons directory (bundled with package)."""
         # Try package directory first
@@ -52,6 +117,74 @@ class AudioRenderer:
         # Fall back to home directory
         return Path.home() / ".config" / "agent-chime" / "earcons"
 
+    def reload_earcons(self) -> None:
+        """
+        Resolve the earcon file for each event type in earcons_dir.
+
+        Called on construction; call again after changing earcons_dir or
+        adding earcon files so play_earcon doesn't hit the filesystem.
+        """
+        candidates = (
+            (event_type, self.earcons_dir / get_earcon_name(event_type)) for event_type in EventType
+        )
+        self._earcon_paths = {et: path for et, path in candidates if path.exists()}
+
+        # Players are created on each earcon's first play
+        self._earcon_players = {}
+
+    def _earcon_player(self, event_type: EventType, earcon_path: Path) -> Any:
+        """Get the AVAudioPlayer for an earcon, creating it on first use; None for afplay."""
+        player = self._earcon_players.get(event_type)
+        if player is not None or self._avfoundation() is None:
+            return player
+
+        try:
+            audio = earcon_path.read_bytes()
+        except OSError:
+            return None
+
+        player = self._create_player(audio)
+        if player is not None:
+            self._earcon_players[event_type] = player
+        return player
+
+    def _create_player(self, audio: bytes) -> Any:
+        """Create a prepared AVAudioPlayer for WAV bytes, or None on failure."""
+        api = self._avfoundation()
+        assert api is not None
+        av_audio_player, ns_data = api
+
+        data = ns_data.dataWithBytes_length_(audio, len(audio))
+        player, error = av_audio_player.alloc().initWithData_error_(data, None)
+        if player is None:
+            logger.warning(f"AVAudioPlayer could not load audio: {error}")
+            return None
+
+        player.prepareToPlay()
+        return player
+
+    def _start_player(self, player: Any, blocking: bool = True) -> None:
+        """Start an AVAudioPlayer from the beginning."""
+        player.setVolume_(self.volume)
+        player.setCurrentTime_(0)
+        if not player.play():
+            raise PlaybackError("AVAudioPlayer failed to start playback")
+
+        self._current_player = player
+        if blocking:
+            while player.isPlaying():
+                time.sleep(0.01)
+
+    def _write_scratch(self, audio: bytes) -> Path:
+        """Write audio to this renderer's scratch file, creating it on first use."""
+        if self._scratch_file is None:
+            fd, name = tempfile.mkstemp(suffix=".wav")
+            os.close(fd)
+            self._scratch_file = Path(name)
+
+        self._scratch_file.write_bytes(audio)
+        return self._scratch_file
+
     def play(self, audio: bytes, blocking: bool = True) -> None:
         """
         Play audio from WAV bytes.
@@ -63,32 +196,84 @@ class AudioRenderer:
         with self._lock:
             self._stop_current()
 
-            # Write to temp file
-            self._temp_file = Path(tempfile.mktemp(suffix=".wav"))
-            self._temp_file.write_bytes(audio)
+            if self._avfoundation() is not None:
+                player = self._create_player(audio)
+                if player is not None:
+                    self._start_player(player, blocking=blocking)
+                    return
+
+            self._play_file(self._write_scratch(audio), blocking=blocking)
+
+    def play_path(self, path: Path, blocking: bool = True) -> None:
+        """
+        Play an existing WAV file without copying it.
+
+        Args:
+            path: Path to the WAV file
+            blocking: If True, wait for playback to complete
+        """
+        with self._lock:
+            self._stop_current()
+            self._play_file(path, blocking=blocking)
+
+    def play_chunks(self, chunks: Iterable[bytes], max_pending: int = 2) -> None:
+        """
+        Play WAV chunks back to back while later chunks are still produced.
+
+        The chunk iterable is consumed on a background thread, so e.g.
+        synthesis of the next sentence overlaps playback of the current
+        one. Exceptions raised by the iterable are re-raised here.
 
-            self._play_file(self._temp_file, blocking=blocking)
+        Args:
+            chunks: Iterable of WAV audio bytes
+            max_pending: Maximum chunks buffered ahead of playback
+        """
+        pending: queue.Queue[bytes | BaseException | None] = queue.Queue(maxsize=max_pending)
+        cancelled = threading.Event()
+
+        def produce() -> None:
+            try:
+                for chunk in chunks:
+                    if cancelled.is_set():
+                        return
+                    pending.put(chunk)
+            except BaseException as e:
+                pending.put(e)
+                return
+            pending.put(None)
+
+        producer = threading.Thread(target=produce, name="audio-chunks", daemon=True)
+        producer.start()
+        try:
+            while (item := pending.get()) is not None:
+                if isinstance(item, BaseException):
+                    raise item
+                self.play(item, blocking=True)
+        finally:
+            cancelled.set()
+            # Unblock the producer if it is waiting on a full queue
+            while producer.is_alive():
+                try:
+                    pending.get_nowait()
+                except queue.Empty:
+                    producer.join(timeout=0.01)
 
     def play_streaming(self, audio: bytes) -> None:
         """
         Update audio during streaming playback.
 
-        Writes updated audio to temp file. The player will read the
+        Writes updated audio to the scratch file. The player will read the
         growing file for progressive playback.
 
         Note: afplay doesn't support true streaming, so this just
         updates the file and restarts playback if needed.
         """
         with self._lock:
-            if self._temp_file is None:
-                # First chunk - start playback
-                self._temp_file = Path(tempfile.mktemp(suffix=".wav"))
-
-            self._temp_file.write_bytes(audio)
+            path = self._write_scratch(audio)
 
             # If not already playing, start
             if self._current_process is None or self._current_process.poll() is not None:
-                self._play_file(self._temp_file, blocking=False)
+                self._play_file(path, blocking=False)
 
     def play_earcon(self, event_type: EventType, blocking: bool = True) -> bool:
         """
@@ -101,16 +286,18 @@ class AudioRenderer:
         Returns:
             True if earcon was played, False if not found
         """
-        earcon_name = get_earcon_name(event_type)
-        earcon_path = self.earcons_dir / earcon_name
-
-        if not earcon_path.exists():
-            logger.warning(f"Earcon not found: {earcon_path}")
+        earcon_path = self._earcon_paths.get(event_type)
+        if earcon_path is None:
+            logger.warning(f"Earcon not found: {self.earcons_dir / get_earcon_name(event_type)}")
             return False
 
         with self._lock:
             self._stop_current()
-            self._play_file(earcon_path, blocking=blocking)
+            player = self._earcon_player(event_type, earcon_path)
+            if player is not None:
+                self._start_player(player, blocking=blocking)
+            else:
+                self._play_file(earcon_path, blocking=blocking)
 
         return True
 
@@ -137,6 +324,10 @@ class AudioRenderer:
 
     def _stop_current(self) -> None:
         """Stop any currently playing audio."""
+        if self._current_player is not None:
+            self._current_player.stop()
+            self._current_player = None
+
         if self._current_process is not None:
             try:
                 self._current_process.terminate()
@@ -145,19 +336,23 @@ class AudioRenderer:
                 self._current_process.kill()
             self._current_process = None
 
-        # Clean up temp file
-        if self._temp_file is not None:
-            try:
-                self._temp_file.unlink(missing_ok=True)
-            except OSError:
-                pass
-            self._temp_file = None
-
     def stop(self) -> None:
-        """Stop playback and clean up."""
+        """Stop playback."""
+        with self._lock:
+            self._stop_current()
+
+    def close(self) -> None:
+        """Stop playback and remove the scratch file."""
         with self._lock:
             self._stop_current()
 
+            if self._scratch_file is not None:
+                try:
+                    self._scratch_file.unlink(missing_ok=True)
+                except OSError:
+                    pass
+                self._scratch_file = None
+
     def wait(self, timeout: float | None = None) -> bool:
         """
         Wait for current playback to complete.
@@ -168,6 +363,14 @@ class AudioRenderer:
         Returns:
             True if playback completed, False if timed out
         """
+        if self._current_player is not None:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while self._current_player.isPlaying():
+                if deadline is not None and time.monotonic() >= deadline:
+                    return False
+                time.sleep(0.01)
+            return True
+
         if self._current_process is None:
             return True
 
@@ -177,9 +380,15 @@ class AudioRenderer:
         except subprocess.TimeoutExpired:
             return False
 
+    def __enter__(self) -> "AudioRenderer":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def __del__(self) -> None:
         """Clean up on destruction."""
-        self.stop()
+        self.close()
 
 
 class AudioRendererPool:
@@ -189,15 +398,14 @@ class AudioRendererPool:
     Maintains a single renderer to avoid resource conflicts.
     """
 
-    _instance: "AudioRendererPool | None" = None
-    _renderer: AudioRenderer | None = None
+    def __init__(self) -> None:
+        self._renderer: AudioRenderer | None = None
+        self._lock = threading.Lock()
 
     @classmethod
     def get_instance(cls) -> "AudioRendererPool":
         """Get the singleton pool instance."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        return _POOL
 
     def get_renderer(
         self,
@@ -206,24 +414,31 @@ class AudioRendererPool:
         earcons_dir: Path | None = None,
     ) -> AudioRenderer:
         """Get or create an audio renderer."""
-        if self._renderer is None:
-            self._renderer = AudioRenderer(
-                volume=volume,
-                cache=cache,
-                earcons_dir=earcons_dir,
-            )
-        else:
-            # Update settings
-            self._renderer.volume = volume
-            if cache is not None:
-                self._renderer.cache = cache
-            if earcons_dir is not None:
-                self._renderer.earcons_dir = earcons_dir
-
-        return self._renderer
+        with self._lock:
+            if self._renderer is None:
+                self._renderer = AudioRenderer(
+                    volume=volume,
+                    cache=cache,
+                    earcons_dir=earcons_dir,
+                )
+            else:
+                # Update settings
+                self._renderer.volume = volume
+                if cache is not None:
+                    self._renderer.cache = cache
+                if earcons_dir is not None and earcons_dir != self._renderer.earcons_dir:
+                    self._renderer.earcons_dir = earcons_dir
+                    self._renderer.reload_earcons()
+
+            return self._renderer
 
     def clear(self) -> None:
         """Stop and clear the renderer."""
-        if self._renderer is not None:
-            self._renderer.stop()
-            self._renderer = None
+        with self._lock:
+            if self._renderer is not None:
+                self._renderer.close()
+                self._renderer = None
+
+
+# Module-level singleton; module import runs exactly once, so no lazy-init race
+_POOL = AudioRendererPool()
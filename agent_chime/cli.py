@@ -1,25 +1,53 @@
 """Command-line interface for agent-chime."""
 
 import argparse
+import atexit
 import json
 import logging
+import os
 import sys
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING
 
 from agent_chime.adapters.base import get_adapter
-from agent_chime.audio.cache import AudioCache
-from agent_chime.audio.renderer import AudioRenderer, PlaybackError
 from agent_chime.config import Config, NotificationMode
-from agent_chime.events import Event, EventType, Source
-from agent_chime.system.detector import SystemDetector
-from agent_chime.system.model_selector import ModelSelector, SelectionMode
-from agent_chime.tts.broker import TTSBroker
-from agent_chime.tts.models import MODELS, QUALITY_ORDER, ModelSpec, ModelTier
-from agent_chime.tts.provider import TTSError, TTSProvider
+from agent_chime.events import EventType, Source
+
+if TYPE_CHECKING:
+    from agent_chime.audio.cache import AudioCache
+    from agent_chime.tts.provider import TTSProvider
+
+# Audio, TTS and system modules are imported inside the commands that use
+# them so hook invocations only pay for what they need (e.g. a cache hit
+# never imports the TTS provider or psutil).
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait at exit for a pending background cache write
+CACHE_WRITE_EXIT_TIMEOUT = 2.0
+
+
+# Prefer orjson for --json/--show output, falling back to the stdlib encoder
+try:
+    import orjson
+
+    def _print_json(data: object) -> None:
+        """Print data as indented JSON."""
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
+
+except ImportError:
+
+    def _print_json(data: object) -> None:
+        """Print data as indented JSON."""
+        print(json.dumps(data, indent=2))
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Configure logging for the CLI."""
@@ -33,6 +61,13 @@ def setup_logging(verbose: bool = False) -> None:
 def cmd_notify(args: argparse.Namespace) -> int:
     """Handle the notify command."""
     config = Config.load()
+    model_id = args.model or config.tts.model
+
+    # Run model selection while stdin is read and the event parsed. This
+    # only probes the system; weights are loaded once a cache miss is known
+    provider_future = None
+    if not args.no_prefetch and _uses_tts(config):
+        provider_future = _prefetch_provider(config, model_id)
 
     # Parse source
     try:
@@ -44,10 +79,11 @@ def cmd_notify(args: argparse.Namespace) -> int:
     # Get adapter and parse input
     adapter = get_adapter(source)
 
-    # Read stdin if not a tty (data is being piped)
+    # Read stdin only for adapters that consume it, and only if data is piped
+    # (an argv-driven source must never block on an inherited open stdin)
     stdin_data = None
-    if not sys.stdin.isatty():
-        stdin_data = sys.stdin.read()
+    if adapter.wants_stdin and not sys.stdin.isatty():
+        stdin_data = sys.stdin.buffer.read().decode("utf-8", errors="replace")
 
     # Get additional argv data (anything after known args)
     argv_data = args.extra_args if hasattr(args, "extra_args") else None
@@ -63,6 +99,8 @@ def cmd_notify(args: argparse.Namespace) -> int:
         logger.debug("No event to process")
         return 0
 
+    from agent_chime.tts.broker import TTSBroker
+
     # Get text to speak via broker
     broker = TTSBroker(config)
     text = broker.get_text_for_event(event, payload)
@@ -76,11 +114,93 @@ def cmd_notify(args: argparse.Namespace) -> int:
         return 0
 
     # Synthesize and play audio
-    return _synthesize_and_play(text, config, args.model)
+    return _synthesize_and_play(text, config, args.model, provider_future)
+
+
+def _uses_tts(config: Config) -> bool:
+    """Check whether any enabled event is configured for speech."""
+    return any(
+        event_config.enabled and event_config.mode == NotificationMode.TTS
+        for event_config in config.events.values()
+    )
+
+
+def _prefetch_provider(config: Config, model_id: str | None) -> "Future[TTSProvider]":
+    """
+    Create a TTSProvider and run model selection on a background thread.
+
+    Errors from the import or constructor are raised by the future's
+    result(); a failed selection is left for synthesize() to retry.
+    """
+    future: Future[TTSProvider] = Future()
+
+    def run() -> None:
+        try:
+            future.set_result(_create_provider(config, model_id, prepare=True))
+        except BaseException as e:
+            future.set_exception(e)
+
+    # Daemon thread so earcon/cache-hit paths can exit without waiting on it
+    threading.Thread(target=run, name="tts-prefetch", daemon=True).start()
+    return future
+
+
+def _warm_up_in_background(provider_future: "Future[TTSProvider]") -> None:
+    """Load the selected model's weights on a background thread."""
+
+    def run() -> None:
+        try:
+            provider_future.result().warmup()
+        except Exception as e:
+            # synthesize() loads the model itself and reports the error
+            logger.debug(f"TTS warmup failed: {e}")
+
+    threading.Thread(target=run, name="tts-warmup", daemon=True).start()
+
+
+def _create_provider(config: Config, model_id: str | None, prepare: bool = False) -> "TTSProvider":
+    """Create a TTSProvider from config, optionally preparing it ahead of use."""
+    from agent_chime.tts.provider import TTSProvider
+
+    provider = TTSProvider(
+        model_id=model_id,
+        voice=config.tts.voice,
+        stream=config.tts.stream,
+        streaming_interval=config.tts.streaming_interval,
+    )
+    if prepare:
+        try:
+            provider.prepare()
+        except Exception as e:
+            # synthesize() will retry selection and report the error
+            logger.debug(f"TTS prefetch failed: {e}")
+    return provider
+
+
+def _cache_in_background(
+    cache: "AudioCache",
+    text: str,
+    voice: str,
+    provider: "TTSProvider",
+    audio: bytes,
+) -> None:
+    """Write synthesized audio to the cache on a background thread."""
+    model = provider.current_model.model_id if provider.current_model else "unknown"
+    writer = threading.Thread(
+        target=cache.put,
+        args=(text, voice, model, audio),
+        name="cache-write",
+        daemon=True,
+    )
+    writer.start()
+    # Give the write a chance to land if the process exits first
+    atexit.register(writer.join, CACHE_WRITE_EXIT_TIMEOUT)
 
 
 def _play_earcon(event_type: EventType, config: Config) -> int:
     """Play an earcon for the event type."""
+    from agent_chime.audio.renderer import AudioRenderer
+
     renderer = AudioRenderer(
         volume=config.volume,
         earcons_dir=config.earcons_dir,
@@ -93,8 +213,21 @@ def _play_earcon(event_type: EventType, config: Config) -> int:
     return 0  # Don't fail on earcon issues
 
 
-def _synthesize_and_play(text: str, config: Config, model_override: str | None = None) -> int:
-    """Synthesize text to speech and play it."""
+def _synthesize_and_play(
+    text: str,
+    config: Config,
+    model_override: str | None = None,
+    provider_future: "Future[TTSProvider] | None" = None,
+) -> int:
+    """
+    Synthesize text to speech and play it.
+
+    With a prefetched provider, a cache miss starts loading the model's
+    weights in the background while the renderer is set up.
+    """
+    from agent_chime.audio.cache import AudioCache
+    from agent_chime.audio.renderer import AudioRenderer, PlaybackError
+
     # Use cache
     cache = AudioCache(cache_dir=config.cache_dir)
 
@@ -104,54 +237,71 @@ def _synthesize_and_play(text: str, config: Config, model_override: str | None =
     # Check cache first
     voice = config.tts.voice or "alba"
     model_for_cache = model_id or "auto"
-    cached = cache.get(text, voice, model_for_cache)
-
-    if cached:
-        logger.debug("Using cached audio")
-        renderer = AudioRenderer(volume=config.volume)
+    cached_path = cache.get_path(text, voice, model_for_cache)
+
+    # Only a cache miss needs the model; load it while the renderer is set up
+    if provider_future is not None and cached_path is None:
+        _warm_up_in_background(provider_future)
+
+    # One renderer serves cached playback, fresh audio and the earcon fallback
+    with AudioRenderer(volume=config.volume, earcons_dir=config.earcons_dir) as renderer:
+        if cached_path:
+            logger.debug("Using cached audio")
+            try:
+                renderer.play_path(cached_path)
+                return 0
+            except PlaybackError as e:
+                logger.error(f"Playback failed: {e}")
+                return 1
+
+        from agent_chime.tts.provider import TTSError, concat_wav
+
+        # Synthesize
         try:
-            renderer.play(cached)
+            if provider_future is not None:
+                provider = provider_future.result()
+            else:
+                provider = _create_provider(config, model_id)
+
+            if config.tts.stream:
+                # Play each sentence as soon as it is synthesized
+                chunks: list[bytes] = []
+
+                def synthesized() -> Iterator[bytes]:
+                    for chunk in provider.synthesize_stream(text):
+                        chunks.append(chunk)
+                        yield chunk
+
+                renderer.play_chunks(synthesized())
+                audio = concat_wav(chunks)
+                if audio is not None:
+                    _cache_in_background(cache, text, voice, provider, audio)
+            else:
+                audio = provider.synthesize(text)
+                # Write the cache entry while the audio plays, not before
+                _cache_in_background(cache, text, voice, provider, audio)
+                renderer.play(audio)
+
             return 0
+
+        except TTSError as e:
+            logger.error(f"TTS failed: {e}")
+            # Try earcon fallback
+            if renderer.play_earcon(EventType.AGENT_YIELD):
+                return 0
+            return 1
+
         except PlaybackError as e:
             logger.error(f"Playback failed: {e}")
             return 1
 
-    # Synthesize
-    try:
-        provider = TTSProvider(
-            model_id=model_id,
-            voice=config.tts.voice,
-            stream=config.tts.stream,
-            streaming_interval=config.tts.streaming_interval,
-        )
-
-        audio = provider.synthesize(text)
-
-        # Cache the result
-        actual_model = provider.current_model.model_id if provider.current_model else "unknown"
-        cache.put(text, voice, actual_model, audio)
-
-        # Play
-        renderer = AudioRenderer(volume=config.volume)
-        renderer.play(audio)
-        return 0
-
-    except TTSError as e:
-        logger.error(f"TTS failed: {e}")
-        # Try earcon fallback
-        renderer = AudioRenderer(volume=config.volume, earcons_dir=config.earcons_dir)
-        if renderer.play_earcon(EventType.AGENT_YIELD):
-            return 0
-        return 1
-
-    except PlaybackError as e:
-        logger.error(f"Playback failed: {e}")
-        return 1
-
 
 def cmd_system_info(args: argparse.Namespace) -> int:
     """Handle the system-info command."""
-    detector = SystemDetector()
+    from agent_chime.system.detector import get_detector
+    from agent_chime.system.model_selector import ModelSelector
+
+    detector = get_detector()
     info = detector.detect()
 
     if args.json:
@@ -161,7 +311,7 @@ def cmd_system_info(args: argparse.Namespace) -> int:
             "metal_available": info.metal_available,
             "chip_name": info.chip_name,
         }
-        print(json.dumps(data, indent=2))
+        _print_json(data)
     else:
         print(f"Total Memory:     {info.total_memory_gb:.1f} GB")
         print(f"Available Memory: {info.available_memory_gb:.1f} GB")
@@ -181,6 +331,9 @@ def cmd_system_info(args: argparse.Namespace) -> int:
 
 def cmd_test_tts(args: argparse.Namespace) -> int:
     """Handle the test-tts command."""
+    from agent_chime.audio.renderer import AudioRenderer, PlaybackError
+    from agent_chime.tts.provider import TTSError, TTSProvider
+
     text = args.text or "Hello! Agent chime is working correctly."
 
     config = Config.load()
@@ -222,50 +375,167 @@ def cmd_test_tts(args: argparse.Namespace) -> int:
         return 1
 
 
-def _get_model_cache_size(model_id: str) -> int | None:
-    """Get the disk size of a cached model in bytes, or None if not cached."""
-    # HuggingFace cache structure: ~/.cache/huggingface/hub/models--{org}--{name}
-    cache_dir = Path.home() / ".cache" / "huggingface" / "hub"
-    if not cache_dir.exists():
-        return None
+# Computed model cache sizes, stored under the agent-chime cache dir
+MODEL_SIZE_CACHE_FILE = "model_sizes.json"
+
+
+def _hf_hub_cache() -> Path:
+    """Resolve the Hugging Face hub cache the way huggingface_hub does."""
+    hub_cache = os.environ.get("HF_HUB_CACHE") or os.environ.get("HUGGINGFACE_HUB_CACHE")
+    if hub_cache:
+        return Path(hub_cache).expanduser()
+
+    hf_home = os.environ.get("HF_HOME")
+    if hf_home:
+        return Path(hf_home).expanduser() / "hub"
+
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    cache_home = Path(xdg_cache).expanduser() if xdg_cache else Path.home() / ".cache"
+    return cache_home / "huggingface" / "hub"
 
+
+# Where mlx-audio's Hugging Face downloads land
+HF_HUB_CACHE = _hf_hub_cache()
+
+
+def _load_size_cache(path: Path) -> dict[str, dict[str, int]]:
+    """Load previously computed model cache sizes."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_size_cache(path: Path, data: dict[str, dict[str, int]]) -> None:
+    """Atomically write computed model cache sizes."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Failed to save model size cache: {e}")
+
+
+def _tree_fingerprint(path: str) -> int:
+    """
+    Latest mtime of a directory and its immediate subdirectories.
+
+    Hugging Face downloads land in blobs/ and snapshots/, which doesn't
+    touch the model root's own mtime, so those are included.
+    """
+    latest = os.stat(path).st_mtime_ns
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                latest = max(latest, entry.stat(follow_symlinks=False).st_mtime_ns)
+    return latest
+
+
+@lru_cache(maxsize=1)
+def _cache_root() -> str | None:
+    """Get the Hugging Face hub cache directory, or None if it doesn't exist."""
+    # HuggingFace cache structure: <hub cache>/models--{org}--{name}
+    # Plain strings from here down: the size walk never needs Path objects
+    root = os.fspath(HF_HUB_CACHE)
+    return root if os.path.isdir(root) else None
+
+
+def _get_model_cache_size(
+    root: str,
+    model_id: str,
+    size_cache: dict[str, dict[str, int]] | None = None,
+) -> int | None:
+    """
+    Get the disk size of a cached model in bytes, or None if not cached.
+
+    If size_cache is given, a previously computed size is reused while
+    the model directory's fingerprint is unchanged, and fresh results
+    are stored back into it.
+    """
     # Convert model_id to cache directory name (e.g., mlx-community/Spark-TTS-0.5B-bf16)
-    cache_name = f"models--{model_id.replace('/', '--')}"
-    model_cache = cache_dir / cache_name
+    model_cache = os.path.join(root, f"models--{model_id.replace('/', '--')}")
 
-    if not model_cache.exists():
+    try:
+        fingerprint = _tree_fingerprint(model_cache)
+    except FileNotFoundError:
+        if size_cache is not None:
+            size_cache.pop(model_id, None)
         return None
 
-    # Calculate total size
+    if size_cache is not None:
+        cached = size_cache.get(model_id)
+        if cached and cached.get("mtime_ns") == fingerprint:
+            return cached["size"]
+
+    total_size = _dir_size(model_cache)
+    if size_cache is not None:
+        size_cache[model_id] = {"mtime_ns": fingerprint, "size": total_size}
+    return total_size
+
+
+def _dir_size(path: str) -> int:
+    """Sum the sizes of regular files under a directory, without following symlinks."""
     total_size = 0
-    for file in model_cache.rglob("*"):
-        if file.is_file():
-            total_size += file.stat().st_size
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                total_size += _dir_size(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                total_size += entry.stat(follow_symlinks=False).st_size
     return total_size
 
 
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def _format_size(size_bytes: int) -> str:
     """Format bytes as human-readable size."""
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} TB"
+    # Each unit spans 10 bits, so the bit length picks the unit directly
+    exponent = min(max(size_bytes.bit_length() - 1, 0) // 10, len(SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * exponent)):.1f} {SIZE_UNITS[exponent]}"
 
 
 def cmd_models(args: argparse.Namespace) -> int:
     """Handle the models command - list available models and cache status."""
-    # Get system info to show which model is recommended
-    detector = SystemDetector()
-    selector = ModelSelector(detector)
-    result = selector.select()
-    recommended_tier = result.tier
+    from agent_chime.system.detector import get_detector
+    from agent_chime.system.model_selector import ModelSelector
+    from agent_chime.tts.models import MODELS, QUALITY_ORDER, ModelTier
+
+    size_cache_path = Config.load().cache_dir / MODEL_SIZE_CACHE_FILE
+    size_cache = _load_size_cache(size_cache_path)
+    previous_size_cache = {k: dict(v) for k, v in size_cache.items()}
+
+    # Each tier's cache walk is an independent, I/O-bound subtree; run them
+    # concurrently, overlapping with system detection below
+    root = _cache_root()
+    with ThreadPoolExecutor(max_workers=len(QUALITY_ORDER)) as executor:
+        size_futures = {
+            tier: executor.submit(_get_model_cache_size, root, MODELS[tier].model_id, size_cache)
+            for tier in QUALITY_ORDER
+            if root is not None
+        }
+
+        # Get system info to show which model is recommended
+        detector = get_detector()
+        selector = ModelSelector(detector)
+        result = selector.select()
+        recommended_tier = result.tier
+
+        cache_sizes: dict[ModelTier, int | None] = dict.fromkeys(QUALITY_ORDER)
+        cache_sizes.update((tier, future.result()) for tier, future in size_futures.items())
+
+    if size_cache != previous_size_cache:
+        _save_size_cache(size_cache_path, size_cache)
 
     if args.json:
         models_data = []
         for tier in QUALITY_ORDER:
             spec = MODELS[tier]
-            cache_size = _get_model_cache_size(spec.model_id)
+            cache_size = cache_sizes[tier]
             models_data.append({
                 "tier": tier.value,
                 "model_id": spec.model_id,
@@ -277,7 +547,7 @@ def cmd_models(args: argparse.Namespace) -> int:
                 "cache_size_bytes": cache_size,
                 "recommended": tier == recommended_tier,
             })
-        print(json.dumps(models_data, indent=2))
+        _print_json(models_data)
         return 0
 
     # Human-readable output
@@ -288,7 +558,7 @@ def cmd_models(args: argparse.Namespace) -> int:
     total_cache_size = 0
     for tier in QUALITY_ORDER:
         spec = MODELS[tier]
-        cache_size = _get_model_cache_size(spec.model_id)
+        cache_size = cache_sizes[tier]
 
         # Header with tier and recommendation marker
         marker = " ★ RECOMMENDED" if tier == recommended_tier else ""
@@ -311,7 +581,7 @@ def cmd_models(args: argparse.Namespace) -> int:
     # Summary
     print("-" * 60)
     print(f"Total cache size: {_format_size(total_cache_size)}")
-    print(f"Cache location:   ~/.cache/huggingface/hub/")
+    print(f"Cache location:   {HF_HUB_CACHE}")
 
     return 0
 
@@ -331,7 +601,7 @@ def cmd_config(args: argparse.Namespace) -> int:
         return 0
 
     if args.show:
-        print(json.dumps(config.to_dict(), indent=2))
+        _print_json(config.to_dict())
         return 0
 
     if args.init:
@@ -357,21 +627,8 @@ def cmd_config(args: argparse.Namespace) -> int:
     return 0
 
 
-def main(argv: list[str] | None = None) -> int:
-    """Main entry point for the CLI."""
-    parser = argparse.ArgumentParser(
-        prog="agent-chime",
-        description="Audible notifications for agentic CLI workflows",
-    )
-    parser.add_argument(
-        "-v", "--verbose",
-        action="store_true",
-        help="Enable verbose logging",
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
-
-    # notify command
+def _add_notify_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the notify command parser."""
     notify_parser = subparsers.add_parser(
         "notify",
         help="Process a notification event",
@@ -391,8 +648,15 @@ def main(argv: list[str] | None = None) -> int:
         "--model",
         help="Override TTS model",
     )
+    notify_parser.add_argument(
+        "--no-prefetch",
+        action="store_true",
+        help="Don't warm up the TTS model while parsing the event",
+    )
 
-    # system-info command
+
+def _add_system_info_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the system-info command parser."""
     sysinfo_parser = subparsers.add_parser(
         "system-info",
         help="Show system information and recommended model",
@@ -403,7 +667,9 @@ def main(argv: list[str] | None = None) -> int:
         help="Output as JSON",
     )
 
-    # test-tts command
+
+def _add_test_tts_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the test-tts command parser."""
     test_parser = subparsers.add_parser(
         "test-tts",
         help="Test TTS synthesis and playback",
@@ -421,7 +687,9 @@ def main(argv: list[str] | None = None) -> int:
         help="Voice to use",
     )
 
-    # models command
+
+def _add_models_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the models command parser."""
     models_parser = subparsers.add_parser(
         "models",
         help="List available TTS models and cache status",
@@ -432,7 +700,9 @@ def main(argv: list[str] | None = None) -> int:
         help="Output as JSON",
     )
 
-    # config command
+
+def _add_config_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the config command parser."""
     config_parser = subparsers.add_parser(
         "config",
         help="Manage configuration",
@@ -458,6 +728,63 @@ def main(argv: list[str] | None = None) -> int:
         help="Force overwrite existing config",
     )
 
+
+ParserBuilder = Callable[[argparse._SubParsersAction], None]
+CommandHandler = Callable[[argparse.Namespace], int]
+
+# Subcommand name -> (parser builder, handler)
+COMMANDS: dict[str, tuple[ParserBuilder, CommandHandler]] = {
+    "notify": (_add_notify_parser, cmd_notify),
+    "system-info": (_add_system_info_parser, cmd_system_info),
+    "test-tts": (_add_test_tts_parser, cmd_test_tts),
+    "models": (_add_models_parser, cmd_models),
+    "config": (_add_config_parser, cmd_config),
+}
+
+
+def _peek_command(argv: list[str]) -> str | None:
+    """Return the subcommand named in argv, or None if it isn't the first positional."""
+    for arg in argv:
+        if arg in ("-v", "--verbose"):
+            continue
+        return arg if arg in COMMANDS else None
+    return None
+
+
+def build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """
+    Build the argument parser.
+
+    If command is given, only that subcommand's parser is constructed;
+    otherwise all subcommands are added (for top-level help and errors).
+    """
+    parser = argparse.ArgumentParser(
+        prog="agent-chime",
+        description="Audible notifications for agentic CLI workflows",
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Enable verbose logging",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+    names = [command] if command is not None else list(COMMANDS)
+    for name in names:
+        add_parser, _ = COMMANDS[name]
+        add_parser(subparsers)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point for the CLI."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Hooks call notify on every agent event; only build the parser we need
+    parser = build_parser(_peek_command(argv))
+
     # Parse known args to allow extra args for codex
     args, extra = parser.parse_known_args(argv)
     args.extra_args = extra
@@ -468,19 +795,12 @@ def main(argv: list[str] | None = None) -> int:
         parser.print_help()
         return 0
 
-    commands = {
-        "notify": cmd_notify,
-        "system-info": cmd_system_info,
-        "test-tts": cmd_test_tts,
-        "models": cmd_models,
-        "config": cmd_config,
-    }
-
-    cmd_func = commands.get(args.command)
-    if cmd_func is None:
+    entry = COMMANDS.get(args.command)
+    if entry is None:
         parser.print_help()
         return 1
 
+    _, cmd_func = entry
     return cmd_func(args)
 
 
@@ -2,7 +2,8 @@
 
 import json
 import logging
-from dataclasses import dataclass, field
+import os
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +11,33 @@ from agent_chime.events import EventType
 
 logger = logging.getLogger(__name__)
 
+# Prefer orjson for config I/O, falling back to the stdlib encoder/decoder
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _encode_default(obj: Any) -> Any:
+        if isinstance(obj, Path):
+            return str(obj)
+        raise TypeError
+
+    def _dumps_config(config: "Config") -> bytes:
+        # orjson serializes the dataclasses natively, in field order, which
+        # matches the to_dict() layout without building the dict first
+        return orjson.dumps(
+            config,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=_encode_default,
+        )
+
+except ImportError:
+    _loads = json.loads
+
+    def _dumps_config(config: "Config") -> bytes:
+        return json.dumps(config.to_dict(), indent=2).encode()
+
+
 # Default config locations
 CONFIG_PATHS = [
     Path.home() / ".config" / "agent-chime" / "config.json",
@@ -17,6 +45,10 @@ CONFIG_PATHS = [
 ]
 
 
+# Parsed configs keyed by path, valid while the file's (mtime_ns, size) match
+_CONFIG_CACHE: dict[Path, tuple[int, int, "Config"]] = {}
+
+
 class NotificationMode:
     """Notification modes for events."""
 
@@ -25,9 +57,14 @@ class NotificationMode:
     SILENT = "silent"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EventConfig:
-    """Configuration for a specific event type."""
+    """
+    Configuration for a specific event type.
+
+    Frozen because the DEFAULT_EVENT_CONFIGS instances are shared by
+    every Config that doesn't override them.
+    """
 
     enabled: bool = True
     mode: str = NotificationMode.TTS
@@ -44,7 +81,7 @@ class EventConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TTSConfig:
     """TTS provider configuration."""
 
@@ -88,7 +125,17 @@ DEFAULT_EVENT_CONFIGS: dict[EventType, EventConfig] = {
 }
 
 
-@dataclass
+# Accepted values for validate()
+_VALID_MODES: frozenset[str] = frozenset(
+    {NotificationMode.TTS, NotificationMode.EARCON, NotificationMode.SILENT}
+)
+_VALID_SELECTION_MODES: frozenset[str] = frozenset({"auto", "manual"})
+
+# Config for event types with neither an explicit nor a default config
+_EMPTY_EVENT_CONFIG = EventConfig()
+
+
+@dataclass(slots=True)
 class Config:
     """Main configuration for agent-chime."""
 
@@ -100,13 +147,16 @@ class Config:
 
     def __post_init__(self) -> None:
         # Fill in any missing event configs with defaults
-        for event_type, default_config in DEFAULT_EVENT_CONFIGS.items():
-            if event_type not in self.events:
-                self.events[event_type] = default_config
+        self.events = {**DEFAULT_EVENT_CONFIGS, **self.events}
 
     def get_event_config(self, event_type: EventType) -> EventConfig:
         """Get configuration for a specific event type."""
-        return self.events.get(event_type, DEFAULT_EVENT_CONFIGS.get(event_type, EventConfig()))
+        # __post_init__ fills in every default, so a miss is rare (e.g.
+        # after config.events is reassigned)
+        try:
+            return self.events[event_type]
+        except KeyError:
+            return DEFAULT_EVENT_CONFIGS.get(event_type, _EMPTY_EVENT_CONFIG)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Config":
@@ -135,27 +185,61 @@ class Config:
 
     @classmethod
     def load(cls, path: Path | None = None) -> "Config":
-        """Load configuration from file or return defaults."""
+        """
+        Load configuration from file or return defaults.
+
+        A file is only re-parsed when its mtime or size changes; otherwise
+        the Config built on the previous load is copied. Each call returns
+        its own Config, so callers may modify it in place.
+        """
         if path:
             paths_to_try = [path]
         else:
             paths_to_try = CONFIG_PATHS
 
         for config_path in paths_to_try:
-            if config_path.exists():
-                try:
-                    with open(config_path) as f:
-                        data = json.load(f)
-                    logger.info(f"Loaded config from {config_path}")
-                    return cls.from_dict(data)
-                except (json.JSONDecodeError, OSError) as e:
-                    logger.warning(f"Failed to load config from {config_path}: {e}")
+            try:
+                stat = os.stat(config_path)
+            except OSError:
+                continue
+
+            cached = _CONFIG_CACHE.get(config_path)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return cached[2]._copy()
+
+            try:
+                data = _loads(config_path.read_bytes())
+                logger.info(f"Loaded config from {config_path}")
+                config = cls.from_dict(data)
+            except (ValueError, OSError) as e:
+                logger.warning(f"Failed to load config from {config_path}: {e}")
+                continue
+
+            _CONFIG_CACHE[config_path] = (stat.st_mtime_ns, stat.st_size, config)
+            return config._copy()
 
         logger.info("Using default configuration")
         return cls()
 
+    def _copy(self) -> "Config":
+        """Copy the mutable parts of this config (EventConfigs are frozen, so shared)."""
+        return replace(self, tts=replace(self.tts), events=dict(self.events))
+
+    @staticmethod
+    def clear_cache(path: Path | None = None) -> None:
+        """Forget previously loaded configs (for one path, or all) so the next load re-reads."""
+        if path is None:
+            _CONFIG_CACHE.clear()
+        else:
+            _CONFIG_CACHE.pop(path, None)
+
     def to_dict(self) -> dict[str, Any]:
-        """Convert config to a dictionary."""
+        """
+        Convert config to a dictionary.
+
+        Keep keys in field order: save() lets orjson serialize the
+        dataclasses directly and relies on the two layouts matching.
+        """
         return {
             "tts": {
                 "model": self.tts.model,
@@ -179,11 +263,22 @@ class Config:
         }
 
     def save(self, path: Path | None = None) -> None:
-        """Save configuration to file."""
+        """
+        Save configuration to file.
+
+        Writes a temporary file and renames it into place, so a concurrent
+        load never sees a partially written config.
+        """
         save_path = path or CONFIG_PATHS[0]
         save_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(save_path, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        tmp_path = save_path.with_suffix(save_path.suffix + ".tmp")
+        try:
+            tmp_path.write_bytes(_dumps_config(self))
+            os.replace(tmp_path, save_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        _CONFIG_CACHE.pop(save_path, None)
         logger.info(f"Saved config to {save_path}")
 
     def validate(self) -> list[str]:
@@ -193,14 +288,14 @@ class Config:
         if not 0 <= self.volume <= 1:
             issues.append(f"Volume {self.volume} should be between 0 and 1")
 
-        if self.tts.selection_mode not in ("auto", "manual"):
+        if self.tts.selection_mode not in _VALID_SELECTION_MODES:
             issues.append(f"Unknown selection_mode: {self.tts.selection_mode}")
 
         if self.tts.selection_mode == "manual" and not self.tts.model:
             issues.append("Manual selection mode requires a model to be specified")
 
         for event_type, config in self.events.items():
-            if config.mode not in (NotificationMode.TTS, NotificationMode.EARCON, NotificationMode.SILENT):
+            if config.mode not in _VALID_MODES:
                 issues.append(f"Unknown mode '{config.mode}' for event {event_type.value}")
 
         return issues
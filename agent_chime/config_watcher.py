@@ -0,0 +1,148 @@
+"""Reload configuration when the config file changes."""
+
+import logging
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from agent_chime.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks when watchdog isn't installed
+POLL_INTERVAL_SECONDS = 300.0
+
+
+def _load_watchdog() -> tuple[Any, Any] | None:
+    """Import watchdog's Observer and FileSystemEventHandler, or None if unavailable."""
+    try:
+        # Optional (the "watch" extra)
+        from watchdog.events import FileSystemEventHandler  # ty: ignore[unresolved-import]
+        from watchdog.observers import Observer  # ty: ignore[unresolved-import]
+    except ImportError:
+        return None
+    return Observer, FileSystemEventHandler
+
+
+class ConfigWatcher:
+    """
+    Calls back with a freshly loaded Config whenever the file changes.
+
+    Uses watchdog (FSEvents on macOS) when installed, so an idle watcher
+    does no work; otherwise falls back to checking the file every
+    poll_interval seconds, which Config.load's mtime memo keeps to a
+    single stat per check.
+
+    Only meant for long-running processes; one-shot CLI invocations
+    should just call Config.load.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        on_change: Callable[[Config], None],
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+    ) -> None:
+        self.path = path
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+
+        self._current = Config.load(path)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._observer: Any = None
+        self._poller: threading.Thread | None = None
+
+    @property
+    def config(self) -> Config:
+        """The most recently loaded configuration."""
+        return self._current
+
+    def start(self) -> "ConfigWatcher":
+        """Start watching the config file."""
+        watchdog = _load_watchdog()
+        if watchdog is None:
+            logger.debug(f"watchdog not installed, polling {self.path} every {self.poll_interval}s")
+            self._poller = threading.Thread(target=self._poll, name="config-poll", daemon=True)
+            self._poller.start()
+            return self
+
+        observer_cls, handler_cls = watchdog
+        watcher = self
+        # FSEvents reports resolved paths (e.g. /private/var for /var), and a
+        # symlinked config changes where its target lives, so compare real paths
+        target = os.path.realpath(self.path)
+
+        class _Handler(handler_cls):
+            def on_any_event(self, event: Any) -> None:
+                # Editors often save via rename, so match either end of a move
+                paths = (event.src_path, getattr(event, "dest_path", None))
+                if any(p and os.path.realpath(os.fsdecode(p)) == target for p in paths):
+                    watcher._reload(invalidate=True)
+
+        # Watch the directory, since the file itself may be replaced
+        self._observer = observer_cls()
+        self._observer.schedule(_Handler(), os.path.dirname(target), recursive=False)
+        self._observer.daemon = True
+        self._observer.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop watching."""
+        self._stopped.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        if self._poller is not None:
+            self._poller.join()
+            self._poller = None
+
+    def _poll(self) -> None:
+        """Check the file periodically until stopped."""
+        while not self._stopped.wait(self.poll_interval):
+            self._reload(invalidate=False)
+
+    def _reload(self, invalidate: bool) -> None:
+        """Load the config and notify if it differs from the current one."""
+        with self._lock:
+            if invalidate:
+                # A change event is authoritative even if mtime and size look unchanged
+                Config.clear_cache(self.path)
+            config = Config.load(self.path)
+            if config == self._current:
+                return
+            self._current = config
+
+        logger.info(f"Config changed: {self.path}")
+        try:
+            self.on_change(config)
+        except Exception as e:
+            logger.warning(f"Config change callback failed: {e}")
+
+    def __enter__(self) -> "ConfigWatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+def watch_config(
+    path: Path,
+    on_change: Callable[[Config], None],
+    poll_interval: float = POLL_INTERVAL_SECONDS,
+) -> ConfigWatcher:
+    """
+    Start watching a config file.
+
+    Args:
+        path: Config file to watch
+        on_change: Called with the new Config after each effective change
+        poll_interval: Seconds between checks when watchdog isn't installed
+
+    Returns:
+        The running ConfigWatcher; call stop() when done
+    """
+    return ConfigWatcher(path, on_change, poll_interval).start()
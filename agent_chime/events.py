@@ -1,12 +1,14 @@
 """Event types for agent-chime notifications."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from enum import Enum
+from enum import StrEnum
+from types import MappingProxyType
 from typing import Any
 
 
-class EventType(Enum):
+class EventType(StrEnum):
     """Types of events that trigger audio notifications."""
 
     AGENT_YIELD = "AGENT_YIELD"
@@ -14,7 +16,7 @@ class EventType(Enum):
     ERROR_RETRY = "ERROR_RETRY"
 
 
-class Priority(Enum):
+class Priority(StrEnum):
     """Event priorities for playback ordering."""
 
     LOW = "low"
@@ -22,7 +24,7 @@ class Priority(Enum):
     HIGH = "high"
 
 
-class Source(Enum):
+class Source(StrEnum):
     """CLI tool sources."""
 
     CLAUDE = "claude"
@@ -30,15 +32,22 @@ class Source(Enum):
     OPENCODE = "opencode"
 
 
-# Default priorities for each event type
-DEFAULT_PRIORITIES: dict[EventType, Priority] = {
+_DEFAULT_PRIORITIES: dict[EventType, Priority] = {
     EventType.AGENT_YIELD: Priority.NORMAL,
     EventType.DECISION_REQUIRED: Priority.HIGH,
     EventType.ERROR_RETRY: Priority.HIGH,
 }
 
+# Default priorities for each event type (read-only view)
+DEFAULT_PRIORITIES: Mapping[EventType, Priority] = MappingProxyType(_DEFAULT_PRIORITIES)
 
-@dataclass
+
+# Bound once, on the dict behind the proxy, so Event construction skips
+# both the attribute lookup and the proxy's indirection
+_default_priority = _DEFAULT_PRIORITIES.get
+
+
+@dataclass(slots=True)
 class Event:
     """Represents a notification event from an agent CLI."""
 
@@ -52,7 +61,7 @@ class Event:
     def __post_init__(self) -> None:
         """Set default priority based on event type if not provided."""
         if self.priority is None:
-            self.priority = DEFAULT_PRIORITIES.get(self.event_type, Priority.NORMAL)
+            self.priority = _default_priority(self.event_type, Priority.NORMAL)
 
     @property
     def is_high_priority(self) -> bool:
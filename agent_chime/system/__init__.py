@@ -1,6 +1,6 @@
 """System detection and model selection."""
 
-from agent_chime.system.detector import SystemDetector, SystemInfo
+from agent_chime.system.detector import SystemDetector, SystemInfo, get_detector
 from agent_chime.system.model_selector import ModelSelector, SelectionResult
 
-__all__ = ["SystemDetector", "SystemInfo", "ModelSelector", "SelectionResult"]
+__all__ = ["SystemDetector", "SystemInfo", "get_detector", "ModelSelector", "SelectionResult"]
@@ -1,15 +1,69 @@
 """System resource detection for macOS Apple Silicon."""
 
+import ctypes
 import logging
 import subprocess
+import sys
+import time
 from dataclasses import dataclass
-
-import psutil
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Seconds a detection result is reused before resources are probed again
+DETECT_MAX_AGE_SECONDS = 60.0
+
+LIBSYSTEM_PATH = "/usr/lib/libSystem.B.dylib"
+
+
+@lru_cache(maxsize=1)
+def _libsystem() -> ctypes.CDLL | None:
+    """Load libSystem for sysctlbyname, or None when not on macOS."""
+    try:
+        lib = ctypes.CDLL(LIBSYSTEM_PATH, use_errno=True)
+    except OSError:
+        return None
+
+    lib.sysctlbyname.argtypes = [
+        ctypes.c_char_p,
+        ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_size_t),
+        ctypes.c_void_p,
+        ctypes.c_size_t,
+    ]
+    lib.sysctlbyname.restype = ctypes.c_int
+    return lib
+
+
+def _sysctl(name: str) -> bytes | None:
+    """Read a raw sysctl value in-process, or None if it can't be read."""
+    lib = _libsystem()
+    if lib is None:
+        return None
+
+    key = name.encode()
+    size = ctypes.c_size_t(0)
+    # First call reports the value's size, second call fills the buffer
+    if lib.sysctlbyname(key, None, ctypes.byref(size), None, 0) != 0:
+        return None
+    buffer = ctypes.create_string_buffer(size.value)
+    if lib.sysctlbyname(key, buffer, ctypes.byref(size), None, 0) != 0:
+        return None
+    return buffer.raw[: size.value]
 
-@dataclass
+
+def _sysctl_command(name: str) -> str:
+    """Read a sysctl value via the sysctl binary."""
+    result = subprocess.run(
+        ["sysctl", "-n", name],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+@dataclass(slots=True)
 class SystemInfo:
     """System resource information."""
 
@@ -29,35 +83,78 @@ class SystemInfo:
 
 
 class SystemDetector:
-    """Detects system resources for model selection."""
+    """
+    Detects system resources for model selection.
+
+    Total memory, Metal support and the chip name can't change while the
+    process runs, so their sysctl/MLX probes run once per instance.
+    Available memory is re-read once the last result is older than
+    max_age.
+    """
 
-    def detect(self) -> SystemInfo:
-        """Detect current system resources."""
-        return SystemInfo(
-            total_memory_gb=self._get_total_memory(),
+    def __init__(self) -> None:
+        self._hardware: tuple[float, bool, str | None] | None = None
+        self._cached: SystemInfo | None = None
+        self._cached_at = 0.0
+
+    def detect(self, max_age: float = DETECT_MAX_AGE_SECONDS) -> SystemInfo:
+        """
+        Detect current system resources.
+
+        Args:
+            max_age: Reuse the previous result if it is at most this many
+                seconds old; pass 0 to re-read available memory
+
+        Returns:
+            SystemInfo for this machine
+        """
+        now = time.monotonic()
+        if self._cached is not None and now - self._cached_at <= max_age:
+            return self._cached
+
+        if self._hardware is None:
+            self._hardware = (
+                self._get_total_memory(),
+                self._check_metal(),
+                self._get_chip_name(),
+            )
+        total_memory_gb, metal_available, chip_name = self._hardware
+
+        self._cached = SystemInfo(
+            total_memory_gb=total_memory_gb,
             available_memory_gb=self._get_available_memory(),
-            metal_available=self._check_metal(),
-            chip_name=self._get_chip_name(),
+            metal_available=metal_available,
+            chip_name=chip_name,
         )
+        self._cached_at = now
+        return self._cached
+
+    def invalidate(self) -> None:
+        """Discard memoized results so the next detect() probes everything."""
+        self._hardware = None
+        self._cached = None
 
     def _get_total_memory(self) -> float:
         """Get total system memory in GB using sysctl."""
+        raw = _sysctl("hw.memsize")
+        if raw is not None and len(raw) == 8:
+            return int.from_bytes(raw, sys.byteorder) / (1024**3)
+
         try:
-            result = subprocess.run(
-                ["sysctl", "-n", "hw.memsize"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            bytes_total = int(result.stdout.strip())
+            bytes_total = int(_sysctl_command("hw.memsize"))
             return bytes_total / (1024**3)
-        except (subprocess.CalledProcessError, ValueError) as e:
+        except (subprocess.CalledProcessError, OSError, ValueError) as e:
             logger.warning(f"Failed to get total memory via sysctl: {e}")
             # Fallback to psutil
+            import psutil
+
             return psutil.virtual_memory().total / (1024**3)
 
     def _get_available_memory(self) -> float:
         """Get available system memory in GB using psutil."""
+        # Imported on first use; importing this module shouldn't pay for psutil
+        import psutil
+
         return psutil.virtual_memory().available / (1024**3)
 
     def _check_metal(self) -> bool:
@@ -75,26 +172,17 @@ class SystemDetector:
 
     def _get_chip_name(self) -> str | None:
         """Get the Apple Silicon chip name."""
+        raw = _sysctl("machdep.cpu.brand_string")
+        if raw is not None:
+            return raw.rstrip(b"\0").decode(errors="replace").strip() or None
+
         try:
-            result = subprocess.run(
-                ["sysctl", "-n", "machdep.cpu.brand_string"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return result.stdout.strip()
-        except subprocess.CalledProcessError:
-            # Try alternative for Apple Silicon
-            try:
-                result = subprocess.run(
-                    ["system_profiler", "SPHardwareDataType"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                for line in result.stdout.splitlines():
-                    if "Chip" in line:
-                        return line.split(":")[-1].strip()
-            except subprocess.CalledProcessError:
-                pass
-        return None
+            return _sysctl_command("machdep.cpu.brand_string") or None
+        except (subprocess.CalledProcessError, OSError):
+            return None
+
+
+@lru_cache(maxsize=1)
+def get_detector() -> SystemDetector:
+    """Get the process-wide SystemDetector, sharing its memoized result."""
+    return SystemDetector()
@@ -2,12 +2,17 @@
 
 import logging
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 
-from agent_chime.system.detector import SystemDetector, SystemInfo
+from agent_chime.system.detector import (
+    DETECT_MAX_AGE_SECONDS,
+    SystemDetector,
+    SystemInfo,
+    get_detector,
+)
 from agent_chime.tts.models import (
-    MODELS,
-    QUALITY_ORDER,
+    LOW_MEMORY_QUALITY_SPECS,
+    QUALITY_SPECS,
     ModelSpec,
     ModelTier,
     get_fallback_model,
@@ -19,15 +24,18 @@ logger = logging.getLogger(__name__)
 # Memory buffer to leave available for the system
 MEMORY_BUFFER_GB = 2.0
 
+# Below this much available memory, prefer quantized models over full precision
+LOW_MEMORY_THRESHOLD_GB = 6.0
+
 
-class SelectionMode(Enum):
+class SelectionMode(StrEnum):
     """Model selection modes."""
 
     AUTO = "auto"  # Automatic based on system resources
     MANUAL = "manual"  # User-specified model
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectionResult:
     """Result of model selection."""
 
@@ -44,7 +52,7 @@ class ModelSelector:
     """Selects the optimal TTS model based on system resources."""
 
     def __init__(self, detector: SystemDetector | None = None) -> None:
-        self.detector = detector or SystemDetector()
+        self.detector = detector or get_detector()
 
     def select(
         self,
@@ -83,6 +91,21 @@ class ModelSelector:
         # Auto-select: try models in quality order
         return self._auto_select(system_info, usable_memory)
 
+    def can_run(self, spec: ModelSpec, max_age: float = DETECT_MAX_AGE_SECONDS) -> bool:
+        """
+        Check whether a model fits the system's current resources.
+
+        Args:
+            spec: Model to check
+            max_age: Maximum age in seconds of the system reading to reuse
+
+        Returns:
+            True if the model would be accepted by selection
+        """
+        system_info = self.detector.detect(max_age)
+        usable_memory = max(0, system_info.available_memory_gb - MEMORY_BUFFER_GB)
+        return self._can_run(spec, system_info, usable_memory)
+
     def _try_user_preference(
         self,
         model_id: str,
@@ -112,8 +135,12 @@ class ModelSelector:
         usable_memory: float,
     ) -> SelectionResult:
         """Auto-select the best model that fits system resources."""
-        for tier in QUALITY_ORDER:
-            spec = MODELS[tier]
+        if system_info.available_memory_gb < LOW_MEMORY_THRESHOLD_GB:
+            candidates = LOW_MEMORY_QUALITY_SPECS
+        else:
+            candidates = QUALITY_SPECS
+
+        for tier, spec in candidates:
             if self._can_run(spec, system_info, usable_memory):
                 reason = self._get_selection_reason(spec, usable_memory, system_info)
                 logger.info(f"Auto-selected {tier.value}: {reason}")
@@ -1,9 +1,11 @@
 """TTS broker for event-to-speech conversion."""
 
 import logging
+from collections.abc import Callable
+from functools import partial
 from typing import Any
 
-from agent_chime.config import Config, EventConfig, NotificationMode
+from agent_chime.config import DEFAULT_EVENT_CONFIGS, Config, EventConfig, NotificationMode
 from agent_chime.events import Event, EventType, Source
 
 logger = logging.getLogger(__name__)
@@ -14,16 +16,68 @@ MAX_SUMMARY_LENGTH = 200
 # Truncation suffix
 TRUNCATION_SUFFIX = " Check the screen for details."
 
+# Fallback spoken text per event type, taken from the default event configs
+_DEFAULT_TEMPLATES: dict[EventType, str] = {
+    event_type: event_config.template for event_type, event_config in DEFAULT_EVENT_CONFIGS.items()
+}
+
+# Earcon filename per event type
+_EARCON_MAP: dict[EventType, str] = {
+    EventType.AGENT_YIELD: "yield.wav",
+    EventType.DECISION_REQUIRED: "decision.wav",
+    EventType.ERROR_RETRY: "error.wav",
+}
+
+
+# Resolves the text to speak for one event type: (event, payload) -> text or None
+TextHandler = Callable[[Event, dict[str, Any] | None], str | None]
+
 
 class TTSBroker:
     """
     Converts events into text for TTS synthesis.
 
     Handles template expansion, summary extraction, and length limiting.
+
+    The per-event-type decisions (enabled, mode, template, whether to read
+    a summary) are resolved from the config once, at construction; call
+    refresh() after changing the config in place (Config.load returns a
+    fresh copy per call, so that change is private to this broker).
     """
 
     def __init__(self, config: Config | None = None) -> None:
         self.config = config or Config()
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Rebuild the per-event-type dispatch table from the config."""
+        self._handlers: dict[EventType, TextHandler] = {
+            event_type: self._build_handler(event_type, event_config)
+            for event_type, event_config in self.config.events.items()
+        }
+        self._earcon_events = frozenset(
+            event_type
+            for event_type, event_config in self.config.events.items()
+            if event_config.enabled and event_config.mode == NotificationMode.EARCON
+        )
+
+    def _build_handler(self, event_type: EventType, event_config: EventConfig) -> TextHandler:
+        """Resolve an event type's config into a function producing its text."""
+        if not event_config.enabled:
+            return partial(self._skip, "disabled")
+
+        if event_config.mode == NotificationMode.SILENT:
+            return partial(self._skip, "silent")
+
+        if event_config.mode == NotificationMode.EARCON:
+            # Earcons don't need text
+            return _no_text
+
+        # For TTS mode, fall back to the template when there's no summary
+        template = event_config.template or self._get_default_template(event_type)
+        if event_config.read_summary:
+            return partial(self._summary_or_template, template)
+        return partial(_fixed_text, template)
 
     def get_text_for_event(self, event: Event, payload: dict[str, Any] | None = None) -> str | None:
         """
@@ -36,33 +90,32 @@ class TTSBroker:
         Returns:
             Text to speak, or None if the event is silent/disabled
         """
-        event_config = self.config.get_event_config(event.event_type)
-
-        if not event_config.enabled:
-            logger.debug(f"Event {event.event_type.value} is disabled")
-            return None
-
-        if event_config.mode == NotificationMode.SILENT:
-            logger.debug(f"Event {event.event_type.value} is silent")
-            return None
-
-        if event_config.mode == NotificationMode.EARCON:
-            # Earcons don't need text
-            return None
-
-        # For TTS mode, determine what to speak
-        if event_config.read_summary:
-            summary = self._extract_summary(event, payload)
-            if summary:
-                return self._limit_length(summary)
-
-        # Fallback to template
-        return event_config.template or self._get_default_template(event.event_type)
+        handler = self._handlers.get(event.event_type)
+        if handler is None:
+            event_config = self.config.get_event_config(event.event_type)
+            handler = self._handlers[event.event_type] = self._build_handler(
+                event.event_type, event_config
+            )
+        return handler(event, payload)
 
     def should_play_earcon(self, event: Event) -> bool:
         """Check if an event should play an earcon."""
-        event_config = self.config.get_event_config(event.event_type)
-        return event_config.enabled and event_config.mode == NotificationMode.EARCON
+        return event.event_type in self._earcon_events
+
+    @staticmethod
+    def _skip(reason: str, event: Event, payload: dict[str, Any] | None) -> None:
+        """Handler for events that produce no speech."""
+        logger.debug(f"Event {event.event_type.value} is {reason}")
+        return None
+
+    def _summary_or_template(
+        self, template: str, event: Event, payload: dict[str, Any] | None
+    ) -> str:
+        """Handler speaking the event's summary, or the template if there is none."""
+        summary = self._extract_summary(event, payload)
+        if summary:
+            return self._limit_length(summary)
+        return template
 
     def _extract_summary(self, event: Event, payload: dict[str, Any] | None) -> str | None:
         """Extract a summary from the event or payload."""
@@ -113,29 +166,28 @@ class TTSBroker:
         if len(text) <= MAX_SUMMARY_LENGTH:
             return text
 
-        # Truncate at word boundary
-        truncated = text[:MAX_SUMMARY_LENGTH]
-        last_space = truncated.rfind(" ")
-        if last_space > MAX_SUMMARY_LENGTH // 2:
-            truncated = truncated[:last_space]
+        # Truncate at word boundary, searching in place so only the kept
+        # prefix is copied
+        last_space = text.rfind(" ", 0, MAX_SUMMARY_LENGTH)
+        cut = last_space if last_space > MAX_SUMMARY_LENGTH // 2 else MAX_SUMMARY_LENGTH
 
-        return truncated + TRUNCATION_SUFFIX
+        return text[:cut] + TRUNCATION_SUFFIX
 
     def _get_default_template(self, event_type: EventType) -> str:
         """Get the default template for an event type."""
-        defaults = {
-            EventType.AGENT_YIELD: "Ready.",
-            EventType.DECISION_REQUIRED: "I need your input.",
-            EventType.ERROR_RETRY: "I hit an error. Please review.",
-        }
-        return defaults.get(event_type, "Notification.")
+        return _DEFAULT_TEMPLATES.get(event_type, "Notification.")
+
+
+def _no_text(event: Event, payload: dict[str, Any] | None) -> None:
+    """Handler for earcon events, which need no text."""
+    return None
+
+
+def _fixed_text(text: str, event: Event, payload: dict[str, Any] | None) -> str:
+    """Handler always speaking the same text."""
+    return text
 
 
 def get_earcon_name(event_type: EventType) -> str:
     """Get the earcon filename for an event type."""
-    earcon_map = {
-        EventType.AGENT_YIELD: "yield.wav",
-        EventType.DECISION_REQUIRED: "decision.wav",
-        EventType.ERROR_RETRY: "error.wav",
-    }
-    return earcon_map.get(event_type, "notification.wav")
+    return _EARCON_MAP.get(event_type, "notification.wav")
@@ -1,19 +1,20 @@
 """TTS model definitions and registry."""
 
-from dataclasses import dataclass
-from enum import Enum
+from dataclasses import dataclass, field
+from enum import StrEnum
 
 
-class ModelTier(Enum):
+class ModelTier(StrEnum):
     """Model quality/resource tiers."""
 
     VOICE_DESIGN = "voice_design"  # Highest quality with emotion control (1.7B params)
     SPARK = "spark"  # High quality (0.5B params)
     SPARK_QUANTIZED = "spark_quantized"  # Quantized, smaller memory
+    SPARK_Q4 = "spark_q4"  # 4-bit quantized, smaller and faster still
     POCKET = "pocket"  # Fastest, smallest (~1GB memory)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelSpec:
     """Specification for a TTS model."""
 
@@ -26,11 +27,11 @@ class ModelSpec:
     lang_code: str = "en"  # Language code for the model
     supports_instruct: bool = False  # Whether model supports emotion/style control via instruct
     default_instruct: str = ""  # Default instruct for emotion control
+    # Whether this is a pocket-tts model; derived from model_id once, at construction
+    is_pocket: bool = field(init=False, repr=False, compare=False)
 
-    @property
-    def is_pocket(self) -> bool:
-        """Check if this is a pocket-tts model."""
-        return "pocket" in self.model_id.lower()
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "is_pocket", "pocket" in self.model_id.lower())
 
     @property
     def is_voice_design(self) -> bool:
@@ -63,12 +64,21 @@ MODELS: dict[ModelTier, ModelSpec] = {
     ModelTier.SPARK_QUANTIZED: ModelSpec(
         model_id="mlx-community/Spark-TTS-0.5B-8bit",
         estimated_memory_gb=2.0,
-        realtime_factor=0.3,
+        realtime_factor=0.6,
         default_voice="",  # Spark doesn't require a voice parameter
         requires_metal=True,
         description="Quantized version, smaller memory footprint",
         lang_code="en",
     ),
+    ModelTier.SPARK_Q4: ModelSpec(
+        model_id="mlx-community/Spark-TTS-0.5B-4bit",
+        estimated_memory_gb=1.2,
+        realtime_factor=0.6,
+        default_voice="",  # Spark doesn't require a voice parameter
+        requires_metal=True,
+        description="4-bit quantized, smallest Spark variant",
+        lang_code="en",
+    ),
     ModelTier.POCKET: ModelSpec(
         model_id="mlx-community/pocket-tts",
         estimated_memory_gb=1.0,
@@ -80,23 +90,45 @@ MODELS: dict[ModelTier, ModelSpec] = {
     ),
 }
 
+# Reverse index of MODELS for lookups by Hugging Face model ID
+_MODELS_BY_ID: dict[str, tuple[ModelTier, ModelSpec]] = {
+    spec.model_id: (tier, spec) for tier, spec in MODELS.items()
+}
+
+# Ultimate fallback, resolved once rather than on every failed synthesis
+_FALLBACK_MODEL = MODELS[ModelTier.POCKET]
+
 # Quality order for selection (try best first)
 QUALITY_ORDER: list[ModelTier] = [
     ModelTier.VOICE_DESIGN,
     ModelTier.SPARK,
     ModelTier.SPARK_QUANTIZED,
+    ModelTier.SPARK_Q4,
     ModelTier.POCKET,
 ]
 
+# Selection order under memory pressure: quantized Spark variants use less
+# bandwidth and synthesize faster, so prefer them over full precision
+LOW_MEMORY_QUALITY_ORDER: list[ModelTier] = [
+    ModelTier.VOICE_DESIGN,
+    ModelTier.SPARK_QUANTIZED,
+    ModelTier.SPARK_Q4,
+    ModelTier.SPARK,
+    ModelTier.POCKET,
+]
+
+# (tier, spec) pairs in quality order, for iterating without dict lookups
+QUALITY_SPECS: list[tuple[ModelTier, ModelSpec]] = [(tier, MODELS[tier]) for tier in QUALITY_ORDER]
+LOW_MEMORY_QUALITY_SPECS: list[tuple[ModelTier, ModelSpec]] = [
+    (tier, MODELS[tier]) for tier in LOW_MEMORY_QUALITY_ORDER
+]
+
 
 def get_model_by_id(model_id: str) -> tuple[ModelTier, ModelSpec] | None:
     """Find a model by its model_id string."""
-    for tier, spec in MODELS.items():
-        if spec.model_id == model_id:
-            return tier, spec
-    return None
+    return _MODELS_BY_ID.get(model_id)
 
 
 def get_fallback_model() -> ModelSpec:
     """Get the ultimate fallback model (pocket-tts - smallest/fastest)."""
-    return MODELS[ModelTier.POCKET]
+    return _FALLBACK_MODEL
@@ -2,28 +2,144 @@
 
 import io
 import logging
+import re
 import tempfile
+import threading
 import wave
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from agent_chime.system.model_selector import ModelSelector, SelectionResult
-from agent_chime.tts.models import MODELS, ModelSpec, ModelTier, get_fallback_model
+from agent_chime.tts.models import (
+    QUALITY_ORDER,
+    QUALITY_SPECS,
+    ModelSpec,
+    get_fallback_model,
+    get_model_by_id,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from agent_chime.system.model_selector import SelectionResult
 
 logger = logging.getLogger(__name__)
 
 
+# In-process cache of synthesized audio for short, frequently repeated texts
+SYNTH_CACHE_MAX_ENTRIES = 128
+SYNTH_CACHE_MAX_TEXT_LENGTH = 200
+
+# Most models synthesize at 16 kHz
+DEFAULT_SAMPLE_RATE = 16000
+
+# (model_id, voice, lang_code, instruct, text)
+SynthesisKey = tuple[str, str | None, str, str | None, str]
+
+_T = TypeVar("_T")
+
+# Sentence boundaries used to split text for streaming synthesis
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+
 class TTSError(Exception):
     """Error during TTS synthesis."""
 
 
+@cache
+def _model_loader() -> Callable[[str], Any] | None:
+    """
+    Import mlx-audio's load_model, or None if unavailable.
+
+    Resolved once: later calls skip the import machinery entirely, while
+    importing this module stays cheap for callers that never synthesize.
+    """
+    try:
+        from mlx_audio.tts.utils import load_model
+    except ImportError:
+        return None
+    return load_model
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text into sentences for incremental synthesis."""
+    return [part for part in _SENTENCE_BOUNDARY.split(text.strip()) if part]
+
+
+def concat_wav(chunks: Iterable[bytes]) -> bytes | None:
+    """
+    Join WAV chunks into a single WAV.
+
+    Returns None if there are no chunks or their formats differ (e.g. a
+    fallback model with another sample rate produced part of the audio).
+    """
+    params = None
+    frames: list[bytes] = []
+    for chunk in chunks:
+        with wave.open(io.BytesIO(chunk), "rb") as reader:
+            chunk_params = reader.getparams()[:3]  # channels, sample width, frame rate
+            if params is None:
+                params = chunk_params
+            elif chunk_params != params:
+                return None
+            frames.append(reader.readframes(reader.getnframes()))
+
+    if params is None:
+        return None
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as writer:
+        writer.setnchannels(params[0])
+        writer.setsampwidth(params[1])
+        writer.setframerate(params[2])
+        writer.writeframes(b"".join(frames))
+    return buffer.getvalue()
+
+
+def encode_wav(segments: Iterable[Any], sample_rate: int) -> bytes:
+    """
+    Encode float audio segments (samples in [-1, 1]) as a 16-bit mono WAV.
+
+    Segments may be mx.array or numpy arrays; they're joined in order.
+    """
+    import numpy as np
+
+    samples = np.concatenate([np.asarray(seg, dtype=np.float32).reshape(-1) for seg in segments])
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2")
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as writer:
+        writer.setnchannels(1)
+        writer.setsampwidth(2)
+        writer.setframerate(sample_rate)
+        writer.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+
+def decode_wav(audio: bytes) -> "tuple[np.ndarray, int]":
+    """Decode a 16-bit mono WAV into float32 samples in [-1, 1] and its sample rate."""
+    import numpy as np
+
+    with wave.open(io.BytesIO(audio), "rb") as reader:
+        if reader.getnchannels() != 1 or reader.getsampwidth() != 2:
+            raise TTSError("Expected 16-bit mono WAV audio")
+        pcm = np.frombuffer(reader.readframes(reader.getnframes()), dtype="<i2")
+        return pcm.astype(np.float32) / 32767, reader.getframerate()
+
+
 class TTSProvider:
     """
-    TTS provider using mlx-audio's generate_audio function.
+    TTS provider synthesizing in memory with mlx-audio models.
 
-    Fallback order: primary model → kokoro → earcon (handled by caller)
+    Fallback order: primary model → each lower quality tier → pocket-tts →
+    earcon (handled by caller)
     """
 
+    # Sample rate assumed when a model doesn't report one
+    sample_rate: int = DEFAULT_SAMPLE_RATE
+
     def __init__(
         self,
         model_id: str | None = None,
@@ -46,17 +162,13 @@ class TTSProvider:
         """Get the currently selected model spec."""
         return self._model_spec
 
-    @property
-    def sample_rate(self) -> int:
-        """Get the sample rate (most models use 16000)."""
-        return 16000
-
     def _select_model(self) -> None:
         """Select the best model based on system resources."""
         if self._model_spec is not None:
             return
 
-        from agent_chime.system.model_selector import SelectionMode
+        # Imported here so importing the provider doesn't pull in system probing
+        from agent_chime.system.model_selector import ModelSelector, SelectionMode
 
         selector = ModelSelector()
         # Use MANUAL mode if user specified a model
@@ -66,6 +178,30 @@ class TTSProvider:
 
         logger.info(f"Selected TTS model: {self._model_spec.model_id}")
 
+    def prepare(self) -> None:
+        """
+        Do model selection ahead of use.
+
+        Safe to call from a background thread before the first
+        synthesize() so system probing overlaps with other startup work.
+        Doesn't import the synthesis backend; see warmup().
+        """
+        self._select_model()
+
+    def warmup(self) -> None:
+        """
+        Select and load the model ahead of the first synthesize().
+
+        Loads the weights into the pool, so only call it once speech is
+        certain to be needed. A no-op without the in-memory mlx-audio API.
+        """
+        self._select_model()
+        assert self._model_spec is not None
+
+        load_model = _model_loader()
+        if load_model is not None:
+            TTSProviderPool.get_instance().get_model(self._model_spec.model_id, load_model)
+
     def _get_voice(self) -> str | None:
         """Get the voice to use, either user-specified or model default."""
         if self.voice:
@@ -92,29 +228,103 @@ class TTSProvider:
         Returns:
             WAV audio as bytes
         """
+        return self._synthesize_with_fallback(text, self._generate_cached)
+
+    def synthesize_pcm(self, text: str) -> "tuple[np.ndarray, int]":
+        """
+        Synthesize text to raw samples, without encoding a WAV.
+
+        For in-process consumers that take PCM directly. Results aren't
+        kept in the synthesis cache, which holds WAV bytes.
+
+        Args:
+            text: Text to synthesize
+
+        Returns:
+            Float32 mono samples in [-1, 1] and their sample rate
+        """
+        return self._synthesize_with_fallback(text, self._generate_pcm)
+
+    def _synthesize_with_fallback(self, text: str, generate: Callable[..., _T]) -> _T:
+        """
+        Run generate(text, model_spec, voice, instruct) down the fallback chain.
+
+        Returns the first successful result; raises TTSError if every model fails.
+        """
         self._select_model()
         assert self._model_spec is not None
 
-        voice = self._get_voice()
-        instruct = self._get_instruct()
         logger.debug(f"Synthesizing: '{text}' with model '{self._model_spec.model_id}'")
 
-        try:
-            return self._generate_with_model(text, self._model_spec, voice, instruct)
-        except Exception as e:
-            logger.error(f"Synthesis failed with {self._model_spec.model_id}: {e}")
-
-            # Try fallback to pocket-tts if not already
-            fallback = get_fallback_model()
-            if self._model_spec.model_id != fallback.model_id:
-                logger.info(f"Falling back to {fallback.model_id}")
-                try:
-                    self._model_spec = fallback
-                    return self._generate_with_model(text, fallback, fallback.default_voice)
-                except Exception as e2:
-                    raise TTSError(f"Failed with fallback model: {e2}") from e
-
-            raise TTSError(f"Synthesis failed: {e}") from e
+        pool = TTSProviderPool.get_instance()
+        last_error: Exception | None = None
+        for model_spec in self._fallback_chain():
+            if model_spec is self._model_spec:
+                voice, instruct = self._get_voice(), self._get_instruct()
+            elif not model_spec.is_pocket and not self._fits(model_spec):
+                # pocket-tts is always tried, as it is the selector's last resort
+                logger.info(f"Skipping fallback {model_spec.model_id}: not enough resources")
+                continue
+            else:
+                logger.info(f"Falling back to {model_spec.model_id}")
+                voice, instruct = model_spec.default_voice, None
+
+            try:
+                result = generate(text, model_spec, voice, instruct)
+            except Exception as e:
+                logger.error(f"Synthesis failed with {model_spec.model_id}: {e}")
+                last_error = e
+                # Release the failed model's weights before loading the next one
+                pool.evict_model(model_spec.model_id)
+                continue
+
+            # Start the next synthesis from the model that worked
+            self._model_spec = model_spec
+            return result
+
+        raise TTSError(f"Synthesis failed with all models: {last_error}") from last_error
+
+    def _fits(self, model_spec: ModelSpec) -> bool:
+        """Check whether the model selector would accept a model right now."""
+        from agent_chime.system.model_selector import ModelSelector
+
+        # Fresh reading: a failed model's weights may just have been released
+        return ModelSelector().can_run(model_spec, max_age=0)
+
+    def _fallback_chain(self) -> list[ModelSpec]:
+        """
+        Get the models to try, in order: the current model, then each lower tier.
+
+        A model outside the registry (e.g. a manually configured ID) falls
+        straight back to pocket-tts.
+        """
+        assert self._model_spec is not None
+        found = get_model_by_id(self._model_spec.model_id)
+        if found is None:
+            return [self._model_spec, get_fallback_model()]
+
+        start = QUALITY_ORDER.index(found[0])
+        return [self._model_spec] + [spec for _, spec in QUALITY_SPECS[start + 1 :]]
+
+    def _generate_cached(
+        self,
+        text: str,
+        model_spec: ModelSpec,
+        voice: str | None,
+        instruct: str | None = None,
+    ) -> bytes:
+        """Generate audio, reusing a recent in-process result for the same inputs."""
+        if len(text) > SYNTH_CACHE_MAX_TEXT_LENGTH:
+            # Long summaries rarely repeat; don't let them push out the templates
+            return self._generate_with_model(text, model_spec, voice, instruct)
+
+        pool = TTSProviderPool.get_instance()
+        key = (model_spec.model_id, voice, model_spec.lang_code, instruct, text)
+        audio = pool.get_audio(key)
+        if audio is None:
+            audio = self._generate_with_model(text, model_spec, voice, instruct)
+            pool.put_audio(key, audio)
+        return audio
 
     def _generate_with_model(
         self,
@@ -123,7 +333,74 @@ class TTSProvider:
         voice: str | None,
         instruct: str | None = None,
     ) -> bytes:
-        """Generate audio using mlx-audio's generate_audio function."""
+        """Generate WAV audio in memory using the mlx-audio model directly."""
+        if _model_loader() is None:
+            # Older mlx-audio without the model API: go through files
+            return self._generate_via_file(text, model_spec, voice, instruct)
+
+        samples, sample_rate = self._generate_pcm(text, model_spec, voice, instruct)
+        return encode_wav([samples], sample_rate)
+
+    def _generate_pcm(
+        self,
+        text: str,
+        model_spec: ModelSpec,
+        voice: str | None,
+        instruct: str | None = None,
+    ) -> "tuple[np.ndarray, int]":
+        """Generate float32 samples and their sample rate with the mlx-audio model."""
+        import numpy as np
+
+        load_model = _model_loader()
+        if load_model is None:
+            return decode_wav(self._generate_via_file(text, model_spec, voice, instruct))
+
+        model = TTSProviderPool.get_instance().get_model(model_spec.model_id, load_model)
+
+        kwargs = self._generate_kwargs(text, model_spec, voice, instruct)
+        segments = []
+        sample_rate = self.sample_rate
+        for result in model.generate(**kwargs):
+            segments.append(np.asarray(result.audio, dtype=np.float32).reshape(-1))
+            sample_rate = result.sample_rate
+
+        if not segments:
+            raise TTSError(f"{model_spec.model_id} produced no audio")
+
+        return np.concatenate(segments), sample_rate
+
+    def _generate_kwargs(
+        self,
+        text: str,
+        model_spec: ModelSpec,
+        voice: str | None,
+        instruct: str | None,
+    ) -> dict[str, Any]:
+        """Build generation kwargs shared by the in-memory and file paths."""
+        kwargs: dict[str, Any] = {
+            "text": text,
+            "verbose": False,
+            "lang_code": model_spec.lang_code,
+        }
+
+        # Add voice if specified and model supports it (not for VoiceDesign)
+        if voice and not model_spec.supports_instruct:
+            kwargs["voice"] = voice
+
+        # Add instruct for VoiceDesign models (emotion/style control)
+        if model_spec.supports_instruct and instruct:
+            kwargs["instruct"] = instruct
+
+        return kwargs
+
+    def _generate_via_file(
+        self,
+        text: str,
+        model_spec: ModelSpec,
+        voice: str | None,
+        instruct: str | None = None,
+    ) -> bytes:
+        """Generate audio using mlx-audio's file-based generate_audio function."""
         try:
             from mlx_audio.tts.generate import generate_audio
         except ImportError as e:
@@ -135,25 +412,8 @@ class TTSProvider:
             file_prefix = str(output_path.with_suffix(""))
 
         try:
-            # Build kwargs for generate_audio
-            kwargs: dict[str, Any] = {
-                "text": text,
-                "model": model_spec.model_id,
-                "file_prefix": file_prefix,
-                "verbose": False,
-                "play": False,
-                "lang_code": model_spec.lang_code,
-            }
-
-            # Add voice if specified and model supports it (not for VoiceDesign)
-            if voice and not model_spec.supports_instruct:
-                kwargs["voice"] = voice
-
-            # Add instruct for VoiceDesign models (emotion/style control)
-            if model_spec.supports_instruct and instruct:
-                kwargs["instruct"] = instruct
-
-            # Call generate_audio
+            kwargs = self._generate_kwargs(text, model_spec, voice, instruct)
+            kwargs.update(model=model_spec.model_id, file_prefix=file_prefix, play=False)
             generate_audio(**kwargs)
 
             # Read the generated file
@@ -172,45 +432,95 @@ class TTSProvider:
 
             return audio_bytes
 
-        except Exception as e:
+        except Exception:
             # Clean up on error
             output_path.unlink(missing_ok=True)
             Path(f"{file_prefix}_000.wav").unlink(missing_ok=True)
             raise
 
-    def synthesize_stream(self, text: str):
+    def synthesize_stream(self, text: str) -> Iterator[bytes]:
         """
-        Synthesize text to WAV audio bytes.
+        Synthesize text incrementally, one sentence at a time.
 
-        Note: mlx-audio's streaming is file-based, so we just return
-        the full audio as a single chunk for now.
+        Streaming happens at sentence granularity: each sentence is a
+        complete WAV, so the first one can be played while the rest are
+        still being synthesized.
 
         Args:
             text: Text to synthesize
 
         Yields:
-            WAV audio bytes (single chunk)
+            WAV audio bytes, one chunk per sentence
         """
-        audio = self.synthesize(text)
-        yield audio
+        for sentence in split_sentences(text):
+            yield self.synthesize(sentence)
+
+    def synthesize_batch(self, texts: Iterable[str]) -> list[bytes]:
+        """
+        Synthesize several texts with one model selection and load.
+
+        Repeated texts in the batch are synthesized once. mlx-audio has no
+        batched decoding API, so texts are generated one after another on
+        the same loaded model.
+
+        Args:
+            texts: Texts to synthesize
+
+        Returns:
+            WAV audio bytes for each text, in order
+        """
+        results: dict[str, bytes] = {}
+        audio = []
+        for text in texts:
+            if text not in results:
+                results[text] = self.synthesize(text)
+            audio.append(results[text])
+        return audio
+
+
+def _provider_matches(
+    provider: TTSProvider,
+    model_id: str | None,
+    voice: str | None,
+    stream: bool,
+) -> bool:
+    """Check whether a pooled provider was created with the given settings."""
+    return provider.model_id == model_id and provider.voice == voice and provider.stream == stream
 
 
 class TTSProviderPool:
     """
-    Pool of TTS providers for reuse.
+    Pool of TTS providers and loaded models for reuse.
 
-    Maintains a single provider instance to avoid repeated model loading.
+    Maintains a single provider instance, and keeps each loaded model so
+    its weights are read and placed on the GPU only once per process
+    (e.g. once per notification rather than once per streamed sentence).
     """
 
     _instance: "TTSProviderPool | None" = None
+    _instance_lock = threading.Lock()
     _provider: TTSProvider | None = None
 
+    def __init__(self) -> None:
+        self._provider_lock = threading.Lock()
+        self._models: dict[str, Any] = {}
+        self._models_lock = threading.Lock()
+
+        # Recently synthesized audio, ordered least to most recently used
+        self._audio: OrderedDict[SynthesisKey, bytes] = OrderedDict()
+        self._audio_lock = threading.Lock()
+
     @classmethod
     def get_instance(cls) -> "TTSProviderPool":
         """Get the singleton pool instance."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        # Lock-free once created; the lock only guards the first construction
+        instance = cls._instance
+        if instance is not None:
+            return instance
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
 
     def get_provider(
         self,
@@ -220,22 +530,80 @@ class TTSProviderPool:
     ) -> TTSProvider:
         """Get or create a TTS provider with the specified settings."""
         # If we have a provider with matching settings, return it
-        if self._provider is not None:
-            if (
-                self._provider.model_id == model_id
-                and self._provider.voice == voice
-                and self._provider.stream == stream
-            ):
-                return self._provider
-
-        # Create new provider
-        self._provider = TTSProvider(
-            model_id=model_id,
-            voice=voice,
-            stream=stream,
-        )
-        return self._provider
+        provider = self._provider
+        if provider is not None and _provider_matches(provider, model_id, voice, stream):
+            return provider
+
+        # Create new provider, unless a concurrent caller just did
+        with self._provider_lock:
+            provider = self._provider
+            if provider is None or not _provider_matches(provider, model_id, voice, stream):
+                provider = TTSProvider(
+                    model_id=model_id,
+                    voice=voice,
+                    stream=stream,
+                )
+                self._provider = provider
+            return provider
+
+    def get_model(self, model_id: str, loader: Callable[[str], Any] | None = None) -> Any:
+        """
+        Get a loaded mlx-audio model, loading it on first use.
+
+        Args:
+            model_id: Hugging Face model ID
+            loader: Function that loads a model by ID (default: mlx-audio's load_model)
+
+        Returns:
+            The loaded model
+        """
+        # Held across the load so concurrent callers don't load the weights twice
+        with self._models_lock:
+            model = self._models.get(model_id)
+            if model is None:
+                loader = loader or _model_loader()
+                if loader is None:
+                    raise TTSError("mlx-audio not installed")
+
+                logger.debug(f"Loading TTS model {model_id}")
+                model = loader(model_id)
+                self._models[model_id] = model
+            return model
+
+    def evict_model(self, model_id: str) -> None:
+        """Drop a loaded model so its weights can be freed."""
+        with self._models_lock:
+            self._models.pop(model_id, None)
+
+    def get_audio(self, key: SynthesisKey) -> bytes | None:
+        """Get recently synthesized audio for the given inputs, if any."""
+        with self._audio_lock:
+            audio = self._audio.get(key)
+            if audio is not None:
+                self._audio.move_to_end(key)
+            return audio
+
+    def put_audio(self, key: SynthesisKey, audio: bytes) -> None:
+        """Remember synthesized audio, evicting the least recently used entry when full."""
+        with self._audio_lock:
+            self._audio[key] = audio
+            self._audio.move_to_end(key)
+            while len(self._audio) > SYNTH_CACHE_MAX_ENTRIES:
+                self._audio.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Forget recently synthesized audio."""
+        with self._audio_lock:
+            self._audio.clear()
+
+    def warmup(self, model_id: str) -> None:
+        """Load a model ahead of the first synthesis."""
+        self.get_model(model_id)
 
     def clear(self) -> None:
-        """Clear the pool."""
-        self._provider = None
+        """Clear the pool, releasing loaded models."""
+        with self._provider_lock:
+            self._provider = None
+        with self._models_lock:
+            self._models.clear()
+        self.clear_cache()
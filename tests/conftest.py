@@ -0,0 +1,20 @@
+"""Shared test fixtures."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from agent_chime.events import Event, EventType, Source
+
+
+@pytest.fixture
+def make_event() -> Callable[..., Event]:
+    """Factory building Events, defaulting to an AGENT_YIELD from Claude."""
+
+    def make(**overrides: Any) -> Event:
+        overrides.setdefault("event_type", EventType.AGENT_YIELD)
+        overrides.setdefault("source", Source.CLAUDE)
+        return Event(**overrides)
+
+    return make
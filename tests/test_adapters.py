@@ -5,7 +5,7 @@ import json
 import pytest
 
 from agent_chime.adapters.base import get_adapter
-from agent_chime.adapters.claude import ClaudeAdapter
+from agent_chime.adapters.claude import DECISION_SCAN_LIMIT, ClaudeAdapter
 from agent_chime.adapters.codex import CodexAdapter
 from agent_chime.adapters.opencode import OpenCodeAdapter
 from agent_chime.events import EventType, Source
@@ -84,6 +84,19 @@ class TestClaudeAdapter:
         assert event is not None
         assert event.event_type == EventType.DECISION_REQUIRED
 
+    def test_decision_keywords_only_scanned_near_start(self):
+        adapter = ClaudeAdapter()
+        payload = json.dumps({
+            "session_id": "abc123",
+            "hook_event_name": "Stop",
+            "reason": "x" * DECISION_SCAN_LIMIT + " please confirm",
+        })
+
+        event, raw = adapter.parse(stdin_data=payload)
+
+        assert event is not None
+        assert event.event_type == EventType.AGENT_YIELD
+
     def test_parse_no_stdin(self):
         adapter = ClaudeAdapter()
         event, raw = adapter.parse(stdin_data=None)
@@ -191,3 +204,11 @@ class TestGetAdapter:
     def test_get_opencode_adapter(self):
         adapter = get_adapter(Source.OPENCODE)
         assert isinstance(adapter, OpenCodeAdapter)
+
+    def test_get_adapter_reuses_instance(self):
+        assert get_adapter(Source.CLAUDE) is get_adapter(Source.CLAUDE)
+
+    def test_only_claude_wants_stdin(self):
+        assert get_adapter(Source.CLAUDE).wants_stdin is True
+        assert get_adapter(Source.CODEX).wants_stdin is False
+        assert get_adapter(Source.OPENCODE).wants_stdin is False
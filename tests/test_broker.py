@@ -99,6 +99,20 @@ class TestTTSBroker:
 
         assert broker.should_play_earcon(event) is True
 
+    def test_refresh_picks_up_config_changes(self):
+        config = Config()
+        broker = TTSBroker(config)
+        event = Event(
+            event_type=EventType.AGENT_YIELD,
+            source=Source.CLAUDE,
+        )
+        assert broker.get_text_for_event(event) == "Ready."
+
+        config.events[EventType.AGENT_YIELD] = EventConfig(template="All done.")
+        broker.refresh()
+
+        assert broker.get_text_for_event(event) == "All done."
+
     def test_should_not_play_earcon_for_tts(self):
         broker = TTSBroker()
         event = Event(
@@ -0,0 +1,128 @@
+"""Tests for the audio cache."""
+
+import tempfile
+from pathlib import Path
+
+from agent_chime.audio.cache import KEY_PREFIX, AudioCache
+
+
+class TestAudioCache:
+    """Tests for AudioCache."""
+
+    def test_put_and_get(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = AudioCache(cache_dir=Path(tmpdir))
+            cache.put("Ready.", "alba", "pocket", b"RIFFdata")
+
+            assert cache.get("Ready.", "alba", "pocket") == b"RIFFdata"
+            assert cache.get("Ready.", "alba", "spark") is None
+
+    def test_size_tracks_puts_and_overwrites(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = AudioCache(cache_dir=Path(tmpdir))
+            cache.put("one", "v", "m", b"x" * 10)
+            cache.put("two", "v", "m", b"x" * 20)
+            cache.put("one", "v", "m", b"x" * 5)
+
+            assert cache.entry_count == 2
+            assert cache.size_bytes == 25
+
+    def test_size_reloaded_from_disk(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = AudioCache(cache_dir=Path(tmpdir))
+            cache.put("one", "v", "m", b"x" * 10)
+            cache.put("two", "v", "m", b"x" * 20)
+
+            reloaded = AudioCache(cache_dir=Path(tmpdir))
+            assert reloaded.entry_count == 2
+            assert reloaded.size_bytes == 30
+
+    def test_evicts_when_max_entries_reached(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = AudioCache(cache_dir=Path(tmpdir), max_entries=2)
+            for i in range(4):
+                cache.put(str(i), "v", "m", b"x" * (i + 1))
+
+            assert cache.entry_count == 2
+            assert cache.size_bytes == 7
+
+    def test_clear(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = AudioCache(cache_dir=Path(tmpdir))
+            cache.put("one", "v", "m", b"x" * 10)
+            cache.clear()
+
+            assert cache.entry_count == 0
+            assert cache.size_bytes == 0
+            assert list(Path(tmpdir).glob("*.wav")) == []
+
+    def test_get_refreshes_lru_position(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = AudioCache(cache_dir=Path(tmpdir), max_entries=2)
+            cache.put("one", "v", "m", b"1")
+            cache.put("two", "v", "m", b"2")
+
+            # Touch "one" so "two" becomes least recently used
+            assert cache.get("one", "v", "m") == b"1"
+            cache.put("three", "v", "m", b"3")
+
+            assert cache.get("one", "v", "m") == b"1"
+            assert cache.get("two", "v", "m") is None
+            assert cache.get("three", "v", "m") == b"3"
+
+    def test_get_path(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = AudioCache(cache_dir=Path(tmpdir))
+            cache.put("Ready.", "alba", "pocket", b"RIFFdata")
+
+            path = cache.get_path("Ready.", "alba", "pocket")
+            assert path is not None
+            assert path.read_bytes() == b"RIFFdata"
+            assert cache.get_path("Ready.", "alba", "spark") is None
+
+    def test_get_path_drops_externally_deleted_entry(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = AudioCache(cache_dir=Path(tmpdir))
+            cache.put("Ready.", "alba", "pocket", b"RIFFdata")
+            path = cache.get_path("Ready.", "alba", "pocket")
+            assert path is not None
+            path.unlink()
+
+            assert cache.get_path("Ready.", "alba", "pocket") is None
+            assert cache.entry_count == 0
+            assert cache.size_bytes == 0
+
+    def test_key_fields_are_unambiguous(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = AudioCache(cache_dir=Path(tmpdir))
+
+            assert cache._cache_key("a|b", "c", "d") != cache._cache_key("a", "b|c", "d")
+
+    def test_key_is_namespaced_by_version_and_hash(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = AudioCache(cache_dir=Path(tmpdir))
+            cache.put("Ready.", "alba", "pocket", b"RIFFdata")
+
+            path = cache.get_path("Ready.", "alba", "pocket")
+            assert path is not None
+            assert path.name.startswith(KEY_PREFIX)
+
+    def test_load_index_above_parallel_threshold(self, monkeypatch):
+        monkeypatch.setattr("agent_chime.audio.cache.PARALLEL_STAT_THRESHOLD", 2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = AudioCache(cache_dir=Path(tmpdir))
+            for i in range(5):
+                cache.put(str(i), "v", "m", b"x" * (i + 1))
+
+            reloaded = AudioCache(cache_dir=Path(tmpdir))
+            assert reloaded.entry_count == 5
+            assert reloaded.size_bytes == 15
+
+    def test_construction_does_not_touch_disk(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir) / "cache"
+            cache = AudioCache(cache_dir=cache_dir)
+            assert not cache_dir.exists()
+
+            cache.put("Ready.", "alba", "pocket", b"RIFFdata")
+            assert cache_dir.exists()
@@ -0,0 +1,20 @@
+"""Tests for CLI helpers."""
+
+import pytest
+
+from agent_chime import cli
+from agent_chime.config import Config
+
+
+class TestPrefetchProvider:
+    """Tests for _prefetch_provider."""
+
+    def test_constructor_error_resolves_future(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr("agent_chime.tts.provider.TTSProvider", fail)
+        future = cli._prefetch_provider(Config(), None)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            future.result(timeout=5)
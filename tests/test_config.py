@@ -6,7 +6,9 @@ from pathlib import Path
 
 import pytest
 
+from agent_chime import config as config_module
 from agent_chime.config import (
+    DEFAULT_EVENT_CONFIGS,
     Config,
     EventConfig,
     NotificationMode,
@@ -26,6 +28,12 @@ class TestTTSConfig:
         assert config.stream is True
         assert config.streaming_interval == 0.5
 
+    def test_reassigned_events_fall_back_to_defaults(self):
+        config = Config()
+        config.events = {}
+        error_config = config.get_event_config(EventType.ERROR_RETRY)
+        assert error_config.mode == NotificationMode.EARCON
+
     def test_from_dict(self):
         data = {
             "model": "mlx-community/pocket-tts",
@@ -143,6 +151,55 @@ class TestConfig:
             loaded = Config.load(config_path)
             assert loaded.volume == 0.6
 
+    def test_saved_file_matches_to_dict(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.json"
+            config = Config(earcons_dir=Path(tmpdir) / "earcons")
+            config.save(config_path)
+
+            assert json.loads(config_path.read_text()) == config.to_dict()
+
+    def test_load_reuses_config_until_file_changes(self, monkeypatch):
+        parses: list[bytes] = []
+        loads = config_module._loads
+        monkeypatch.setattr(config_module, "_loads", lambda b: parses.append(b) or loads(b))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.json"
+            config_path.write_text(json.dumps({"volume": 0.6}))
+
+            first = Config.load(config_path)
+            assert Config.load(config_path) == first
+            assert len(parses) == 1
+
+            config_path.write_text(json.dumps({"volume": 0.25}))
+            reloaded = Config.load(config_path)
+            assert len(parses) == 2
+            assert reloaded.volume == 0.25
+
+    def test_load_returns_independent_copies(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.json"
+            config_path.write_text(json.dumps({"volume": 0.6, "tts": {"voice": "alba"}}))
+
+            first = Config.load(config_path)
+            first.volume = 0.1
+            first.tts.voice = "marius"
+            first.events.clear()
+
+            second = Config.load(config_path)
+            assert second.volume == 0.6
+            assert second.tts.voice == "alba"
+            assert second.events == DEFAULT_EVENT_CONFIGS
+
+    def test_load_malformed_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.json"
+            config_path.write_text("{not json")
+
+            config = Config.load(config_path)
+            # Should return defaults
+            assert config.volume == 0.8
+
     def test_load_missing_file(self):
         config = Config.load(Path("/nonexistent/config.json"))
         # Should return defaults
@@ -0,0 +1,88 @@
+"""Tests for config file watching."""
+
+import json
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+from agent_chime.config_watcher import watch_config
+
+
+class TestConfigWatcher:
+    """Tests for ConfigWatcher."""
+
+    def test_polling_reports_changes(self, monkeypatch):
+        monkeypatch.setattr("agent_chime.config_watcher._load_watchdog", lambda: None)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.json"
+            config_path.write_text(json.dumps({"volume": 0.6}))
+
+            changed = threading.Event()
+            volumes: list[float] = []
+
+            def on_change(config):
+                volumes.append(config.volume)
+                changed.set()
+
+            watcher = watch_config(config_path, on_change, poll_interval=0.01)
+            try:
+                assert watcher.config.volume == 0.6
+                config_path.write_text(json.dumps({"volume": 0.25}))
+                assert changed.wait(timeout=5)
+            finally:
+                watcher.stop()
+
+            assert volumes == [0.25]
+            assert watcher.config.volume == 0.25
+
+    def test_watchdog_matches_symlinked_config(self, monkeypatch):
+        scheduled: list[tuple[Any, str]] = []
+
+        class FakeObserver:
+            daemon = False
+
+            def schedule(self, handler, path, recursive):
+                scheduled.append((handler, path))
+
+            def start(self):
+                pass
+
+            def stop(self):
+                pass
+
+            def join(self):
+                pass
+
+        class FakeEvent:
+            def __init__(self, src_path, dest_path=None):
+                self.src_path = src_path
+                self.dest_path = dest_path
+
+        monkeypatch.setattr(
+            "agent_chime.config_watcher._load_watchdog", lambda: (FakeObserver, object)
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            real_dir = Path(tmpdir) / "dotfiles"
+            real_dir.mkdir()
+            real_path = real_dir / "config.json"
+            real_path.write_text(json.dumps({"volume": 0.6}))
+            link_path = Path(tmpdir) / "config.json"
+            link_path.symlink_to(real_path)
+
+            volumes: list[float] = []
+            watcher = watch_config(link_path, lambda config: volumes.append(config.volume))
+            try:
+                [(handler, watched_dir)] = scheduled
+                assert Path(watched_dir) == real_dir.resolve()
+
+                real_path.write_text(json.dumps({"volume": 0.25}))
+                handler.on_any_event(FakeEvent(str(real_dir / "other.json")))
+                assert volumes == []
+
+                # Saved via rename, reported with the resolved target path
+                handler.on_any_event(FakeEvent(str(real_dir / ".tmp"), str(real_path.resolve())))
+            finally:
+                watcher.stop()
+
+            assert volumes == [0.25]
@@ -0,0 +1,36 @@
+"""Tests for model selection."""
+
+from agent_chime.system.detector import DETECT_MAX_AGE_SECONDS, SystemDetector, SystemInfo
+from agent_chime.system.model_selector import ModelSelector
+from agent_chime.tts.models import ModelTier
+
+
+class FixedDetector(SystemDetector):
+    """Detector reporting fixed resources."""
+
+    def __init__(self, available_memory_gb: float, metal_available: bool = True) -> None:
+        super().__init__()
+        self.info = SystemInfo(
+            total_memory_gb=16.0,
+            available_memory_gb=available_memory_gb,
+            metal_available=metal_available,
+        )
+
+    def detect(self, max_age: float = DETECT_MAX_AGE_SECONDS) -> SystemInfo:
+        return self.info
+
+
+class TestAutoSelect:
+    """Tests for automatic model selection."""
+
+    def test_low_memory_prefers_quantized_spark(self):
+        result = ModelSelector(FixedDetector(available_memory_gb=5.5)).select()
+        assert result.tier == ModelTier.SPARK_QUANTIZED
+
+    def test_above_threshold_prefers_full_precision_spark(self):
+        result = ModelSelector(FixedDetector(available_memory_gb=6.5)).select()
+        assert result.tier == ModelTier.SPARK
+
+    def test_without_metal_falls_back_to_pocket(self):
+        detector = FixedDetector(available_memory_gb=32.0, metal_available=False)
+        assert ModelSelector(detector).select().tier == ModelTier.POCKET
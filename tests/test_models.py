@@ -3,6 +3,7 @@
 import pytest
 
 from agent_chime.tts.models import (
+    LOW_MEMORY_QUALITY_ORDER,
     MODELS,
     QUALITY_ORDER,
     ModelSpec,
@@ -15,10 +16,16 @@ from agent_chime.tts.models import (
 class TestModelTier:
     """Tests for ModelTier enum."""
 
-    def test_tiers_exist(self):
-        assert ModelTier.POCKET.value == "pocket"
-        assert ModelTier.SPARK.value == "spark"
-        assert ModelTier.SPARK_QUANTIZED.value == "spark_quantized"
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (ModelTier.POCKET, "pocket"),
+            (ModelTier.SPARK, "spark"),
+            (ModelTier.SPARK_QUANTIZED, "spark_quantized"),
+        ],
+    )
+    def test_tiers_exist(self, member, value):
+        assert member.value == value
 
 
 class TestModelSpec:
@@ -58,14 +65,22 @@ class TestModelSpec:
 class TestModels:
     """Tests for the model registry."""
 
-    def test_all_tiers_have_models(self):
-        for tier in ModelTier:
-            assert tier in MODELS
-            assert isinstance(MODELS[tier], ModelSpec)
+    @pytest.mark.parametrize("tier", list(ModelTier))
+    def test_all_tiers_have_models(self, tier):
+        assert tier in MODELS
+        assert isinstance(MODELS[tier], ModelSpec)
 
-    def test_quality_order_includes_all_tiers(self):
-        for tier in ModelTier:
-            assert tier in QUALITY_ORDER
+    @pytest.mark.parametrize("tier", list(ModelTier))
+    def test_quality_order_includes_all_tiers(self, tier):
+        assert tier in QUALITY_ORDER
+
+    def test_low_memory_order_includes_all_tiers(self):
+        assert sorted(LOW_MEMORY_QUALITY_ORDER) == sorted(QUALITY_ORDER)
+
+    def test_low_memory_order_prefers_quantized_spark(self):
+        order = LOW_MEMORY_QUALITY_ORDER
+        assert order.index(ModelTier.SPARK_QUANTIZED) < order.index(ModelTier.SPARK)
+        assert order.index(ModelTier.SPARK_Q4) < order.index(ModelTier.SPARK)
 
     def test_quality_order_is_descending(self):
         # First should be highest quality (largest)
@@ -73,14 +88,10 @@ class TestModels:
         # Last should be smallest/fastest
         assert QUALITY_ORDER[-1] == ModelTier.POCKET
 
-    def test_pocket_is_fallback(self):
-        pocket = MODELS[ModelTier.POCKET]
-        assert not pocket.requires_metal
-        assert pocket.estimated_memory_gb <= 1.0
-
-    def test_spark_models_require_metal(self):
-        assert MODELS[ModelTier.SPARK].requires_metal
-        assert MODELS[ModelTier.SPARK_QUANTIZED].requires_metal
+    def test_only_pocket_runs_without_metal(self):
+        for tier, spec in MODELS.items():
+            assert spec.requires_metal == (tier != ModelTier.POCKET), tier
+        assert MODELS[ModelTier.POCKET].estimated_memory_gb <= 1.0
 
 
 class TestGetModelById:
@@ -99,6 +110,11 @@ class TestGetModelById:
         tier, spec = result
         assert tier == ModelTier.SPARK
 
+    @pytest.mark.parametrize("tier", list(ModelTier))
+    def test_every_registered_model_is_found(self, tier):
+        spec = MODELS[tier]
+        assert get_model_by_id(spec.model_id) == (tier, spec)
+
     def test_unknown_model_returns_none(self):
         result = get_model_by_id("unknown/model")
         assert result is None
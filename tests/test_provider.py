@@ -0,0 +1,263 @@
+"""Tests for TTS provider helpers."""
+
+import io
+import threading
+import wave
+
+import pytest
+
+from agent_chime.tts.models import MODELS, ModelTier, get_fallback_model
+from agent_chime.tts.provider import (
+    TTSError,
+    TTSProvider,
+    TTSProviderPool,
+    concat_wav,
+    decode_wav,
+    encode_wav,
+    split_sentences,
+)
+
+
+def _wav(frames: int, rate: int = 24000) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(b"\x00\x00" * frames)
+    return buffer.getvalue()
+
+
+class TestSplitSentences:
+    """Tests for split_sentences."""
+
+    def test_splits_on_terminal_punctuation(self):
+        assert split_sentences("Done. Ready!  Continue?") == ["Done.", "Ready!", "Continue?"]
+
+    def test_single_sentence(self):
+        assert split_sentences("Task complete") == ["Task complete"]
+
+
+class TestConcatWav:
+    """Tests for concat_wav."""
+
+    def test_joins_frames(self):
+        audio = concat_wav([_wav(10), _wav(5)])
+        assert audio is not None
+        with wave.open(io.BytesIO(audio)) as w:
+            assert w.getnframes() == 15
+
+    def test_format_mismatch_returns_none(self):
+        assert concat_wav([_wav(10), _wav(5, rate=16000)]) is None
+
+    def test_no_chunks_returns_none(self):
+        assert concat_wav([]) is None
+
+
+class TestEncodeWav:
+    """Tests for encode_wav."""
+
+    def test_encodes_segments_as_16_bit_mono(self):
+        audio = encode_wav([[0.0, 0.5], [-1.0, 2.0]], 24000)
+        with wave.open(io.BytesIO(audio)) as w:
+            assert w.getnchannels() == 1
+            assert w.getsampwidth() == 2
+            assert w.getframerate() == 24000
+            assert w.getnframes() == 4
+            # Out-of-range samples are clipped
+            assert w.readframes(4)[-2:] == (32767).to_bytes(2, "little", signed=True)
+
+
+class TestDecodeWav:
+    """Tests for decode_wav."""
+
+    def test_round_trips_encode_wav(self):
+        samples, rate = decode_wav(encode_wav([[0.0, 0.5, -1.0]], 24000))
+        assert rate == 24000
+        assert samples.tolist() == pytest.approx([0.0, 0.5, -1.0], abs=1e-4)
+
+    def test_rejects_stereo(self):
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as w:
+            w.setnchannels(2)
+            w.setsampwidth(2)
+            w.setframerate(24000)
+            w.writeframes(b"\x00\x00" * 4)
+        with pytest.raises(TTSError):
+            decode_wav(buffer.getvalue())
+
+
+class TestSynthesizePcm:
+    """Tests for synthesize_pcm."""
+
+    def test_returns_samples_from_the_model(self, monkeypatch):
+        class Result:
+            def __init__(self, audio):
+                self.audio = audio
+                self.sample_rate = 24000
+
+        class Model:
+            def generate(self, **kwargs):
+                yield Result([0.25, 0.5])
+                yield Result([-0.5])
+
+        def loader():
+            return lambda model_id: Model()
+
+        monkeypatch.setattr("agent_chime.tts.provider._model_loader", loader)
+        provider = TTSProvider()
+        provider._model_spec = get_fallback_model()
+        try:
+            samples, rate = provider.synthesize_pcm("Ready.")
+        finally:
+            TTSProviderPool.get_instance().clear()
+
+        assert rate == 24000
+        assert samples.tolist() == [0.25, 0.5, -0.5]
+
+
+class TestWarmup:
+    """Tests for prepare() and warmup()."""
+
+    def test_only_warmup_loads_weights(self, monkeypatch):
+        loaded: list[str] = []
+
+        def loader():
+            return loaded.append
+
+        monkeypatch.setattr("agent_chime.tts.provider._model_loader", loader)
+        provider = TTSProvider()
+        provider._model_spec = get_fallback_model()
+        try:
+            provider.prepare()
+            assert loaded == []
+            provider.warmup()
+        finally:
+            TTSProviderPool.get_instance().clear()
+
+        assert loaded == [get_fallback_model().model_id]
+
+
+class TestSynthesisCache:
+    """Tests for the in-process synthesis cache."""
+
+    def test_repeated_text_is_generated_once(self, monkeypatch):
+        TTSProviderPool.get_instance().clear_cache()
+        calls: list[str] = []
+
+        def generate(self, text, model_spec, voice, instruct=None):
+            calls.append(text)
+            return _wav(len(text))
+
+        monkeypatch.setattr(TTSProvider, "_generate_with_model", generate)
+        provider = TTSProvider()
+        provider._model_spec = get_fallback_model()
+
+        assert provider.synthesize("Ready.") == provider.synthesize("Ready.")
+        provider.synthesize("x" * 300)
+        provider.synthesize("x" * 300)
+
+        assert calls == ["Ready.", "x" * 300, "x" * 300]
+
+
+class TestFallbackChain:
+    """Tests for falling back through lower quality tiers."""
+
+    def test_falls_back_to_next_tier_and_stays_there(self, monkeypatch):
+        TTSProviderPool.get_instance().clear_cache()
+        calls: list[str] = []
+
+        def generate(self, text, model_spec, voice, instruct=None):
+            calls.append(model_spec.model_id)
+            if model_spec is MODELS[ModelTier.VOICE_DESIGN]:
+                raise RuntimeError("out of memory")
+            return _wav(len(text))
+
+        monkeypatch.setattr(TTSProvider, "_generate_with_model", generate)
+        monkeypatch.setattr(TTSProvider, "_fits", lambda self, spec: True)
+        provider = TTSProvider()
+        provider._model_spec = MODELS[ModelTier.VOICE_DESIGN]
+
+        provider.synthesize("Ready.")
+        provider.synthesize("Done.")
+
+        spark = MODELS[ModelTier.SPARK].model_id
+        assert calls == [MODELS[ModelTier.VOICE_DESIGN].model_id, spark, spark]
+        assert provider.current_model is MODELS[ModelTier.SPARK]
+
+    def test_skips_tiers_that_do_not_fit_and_evicts_failed_models(self, monkeypatch):
+        pool = TTSProviderPool.get_instance()
+        pool.clear_cache()
+        failing = MODELS[ModelTier.SPARK]
+        pool._models[failing.model_id] = object()
+        calls: list[str] = []
+
+        def generate(self, text, model_spec, voice, instruct=None):
+            calls.append(model_spec.model_id)
+            if model_spec is failing:
+                raise RuntimeError("out of memory")
+            return _wav(len(text))
+
+        monkeypatch.setattr(TTSProvider, "_generate_with_model", generate)
+        monkeypatch.setattr(TTSProvider, "_fits", lambda self, spec: spec.estimated_memory_gb < 2)
+        provider = TTSProvider()
+        provider._model_spec = failing
+
+        provider.synthesize("Ready.")
+
+        # 8-bit Spark (2 GB) is skipped; 4-bit Spark fits
+        assert calls == [failing.model_id, MODELS[ModelTier.SPARK_Q4].model_id]
+        assert failing.model_id not in pool._models
+
+    def test_raises_when_every_tier_fails(self, monkeypatch):
+        TTSProviderPool.get_instance().clear_cache()
+
+        def generate(self, text, model_spec, voice, instruct=None):
+            raise RuntimeError("broken")
+
+        monkeypatch.setattr(TTSProvider, "_generate_with_model", generate)
+        monkeypatch.setattr(TTSProvider, "_fits", lambda self, spec: True)
+        provider = TTSProvider()
+        provider._model_spec = MODELS[ModelTier.SPARK_Q4]
+
+        with pytest.raises(TTSError):
+            provider.synthesize("Ready.")
+        assert provider._fallback_chain() == [MODELS[ModelTier.SPARK_Q4], get_fallback_model()]
+
+
+class TestProviderPool:
+    """Tests for TTSProviderPool."""
+
+    def test_concurrent_get_provider_shares_one_instance(self):
+        pool = TTSProviderPool()
+        barrier = threading.Barrier(8)
+        providers: list[TTSProvider] = []
+
+        def get():
+            barrier.wait()
+            providers.append(pool.get_provider(model_id="m", voice="v"))
+
+        threads = [threading.Thread(target=get) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(p) for p in providers}) == 1
+
+
+class TestSynthesizeBatch:
+    """Tests for synthesize_batch."""
+
+    def test_repeated_texts_are_synthesized_once(self, monkeypatch):
+        calls: list[str] = []
+
+        def synthesize(self, text):
+            calls.append(text)
+            return text.encode()
+
+        monkeypatch.setattr(TTSProvider, "synthesize", synthesize)
+        audio = TTSProvider().synthesize_batch(["Ready.", "Done.", "Ready."])
+
+        assert audio == [b"Ready.", b"Done.", b"Ready."]
+        assert calls == ["Ready.", "Done."]